@@ -115,17 +115,8 @@ def append_export_collection(blend_path: str, collection_name: str) -> bpy.types
 
 
 def iter_collection_objects_recursive(col: bpy.types.Collection):
-    seen = set()
-
-    def _walk(c):
-        for obj in c.objects:
-            if obj.name not in seen:
-                seen.add(obj.name)
-                yield obj
-        for child in c.children:
-            yield from _walk(child)
-
-    yield from _walk(col)
+    # all_objects walks child collections and de-duplicates in C.
+    return iter(col.all_objects[:])
 
 
 def duplicate_objects_linked(objs, target_collection: bpy.types.Collection):
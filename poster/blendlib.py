@@ -15,25 +15,142 @@ Highlights:
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
 import math
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import bpy
+import numpy as np
 from mathutils import Euler, Vector, Matrix
 
+try:  # Optional faster JSON parser; Blender's bundled Python does not ship it.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ----------------------------
 # Manifest + path helpers
 # ----------------------------
 
 
+# Object-entry keys (besides any "*_mm" key) that hold numeric vectors.
+_VECTOR_KEYS = frozenset(("rotation_deg", "scale", "color_rgba", "up", "dir"))
+
+
+def _is_vector_key(key: str) -> bool:
+    return key.endswith("_mm") or key in _VECTOR_KEYS
+
+
+def _coerce_vectors(entry: Dict[str, Any], where: str) -> None:
+    """Convert numeric vector lists in a manifest entry to tuples of floats, in place.
+
+    Nested dicts (e.g. an object's "view" block) are handled recursively.
+    """
+    for key, val in entry.items():
+        if isinstance(val, dict):
+            _coerce_vectors(val, f"{where}.{key}")
+        elif isinstance(val, list) and _is_vector_key(key):
+            if any(isinstance(v, (list, dict, str)) for v in val):
+                continue
+            try:
+                entry[key] = tuple(float(v) for v in val)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Manifest {where}.{key}: expected numbers, got {val!r}") from e
+
+
+# Object-entry keys holding case-insensitive keywords (e.g. "space": "poster").
+_KEYWORD_KEYS = ("space", "fit")
+
+
+def _normalize_keywords(entry: Dict[str, Any]) -> None:
+    """Upper-case and intern keyword values in place so builders compare them directly."""
+    for key in _KEYWORD_KEYS:
+        val = entry.get(key)
+        if isinstance(val, str):
+            entry[key] = sys.intern(val.strip().upper())
+    view = entry.get("view")
+    if isinstance(view, dict) and isinstance(view.get("target_mode"), str):
+        view["target_mode"] = sys.intern(view["target_mode"].strip().upper())
+
+
+def _validate_object_entry(entry: Any, i: int) -> None:
+    """Check the fields every builder indexes directly, once, at load time."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"Manifest objects[{i}]: expected an object, got {type(entry).__name__}")
+    if not entry.get("enabled", True):
+        return
+    name = entry.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"Manifest objects[{i}]: missing or non-string 'name'")
+    kind = entry.get("kind")
+    if kind is not None and not isinstance(kind, str):
+        raise ValueError(f"Manifest objects[{name}].kind: expected a string, got {kind!r}")
+
+
+# Parsed manifests keyed by resolved path -> ((mtime_ns, size), cfg).
+_MANIFEST_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def load_manifest(path: str | Path) -> Dict[str, Any]:
-    p = Path(path)
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load the manifest and normalize object entries once.
+
+    Object entries are validated (enabled entries need a string "name"), vector
+    fields become float tuples (so bad numeric data fails early, with the object
+    name, instead of deep inside a builder) and keyword fields such as "space"
+    are upper-cased.
+
+    Results are cached in-process keyed by (mtime_ns, size) of the file, so
+    re-running open.py/render.py in the same Blender session skips the parse.
+    Every call returns a deep copy of the cached dict, so a caller mutating its
+    result can't leak into later loads.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _MANIFEST_CACHE.get(str(p))
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    # Both parsers take the raw UTF-8 bytes, skipping a separate text decode.
+    cfg = _json_loads(p.read_bytes())
+    for i, obj_cfg in enumerate(cfg.get("objects", [])):
+        _validate_object_entry(obj_cfg, i)
+        _coerce_vectors(obj_cfg, f"objects[{obj_cfg.get('name', i)}]")
+        _normalize_keywords(obj_cfg)
+    _MANIFEST_CACHE[str(p)] = (stamp, cfg)
+    return copy.deepcopy(cfg)
+
+
+# Custom property storing the hash of the manifest entry an object was last built from.
+_MANIFEST_HASH_PROP = "_manifest_hash"
+# Bump when a builder that checks _MANIFEST_HASH_PROP (image planes, backdrops,
+# area lights, ...) changes what it builds, so saved scenes are rebuilt.
+_BUILDER_VERSION = "builders_v2"
+
+
+def _manifest_entry_hash(obj_cfg: Dict[str, Any], *extra: Any) -> str:
+    """Stable short hash of a manifest object entry (plus any extra build inputs).
+
+    Includes _BUILDER_VERSION, so builder changes invalidate stored hashes.
+    """
+    payload = json.dumps([_BUILDER_VERSION, obj_cfg, list(extra)], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _unchanged_object(name: str, entry_hash: str) -> Optional[bpy.types.Object]:
+    """Return the existing object if it was built from an identical manifest entry."""
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.get(_MANIFEST_HASH_PROP) == entry_hash:
+        return obj
+    return None
 
 
 def abspath_from_manifest(manifest_path: str | Path, maybe_rel: str | Path) -> str:
@@ -44,7 +161,15 @@ def abspath_from_manifest(manifest_path: str | Path, maybe_rel: str | Path) -> s
     3) If that doesn't exist, we also try resolving against the repo root
        (parent of the manifest directory), so manifests can use "assets/..."
        while living under "poster/".
+
+    Results are memoized per apply_manifest() pass (resolve() and exists() are
+    filesystem calls; the same paths are resolved several times per apply).
     """
+    return _resolve_manifest_path(str(manifest_path), str(maybe_rel))
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_manifest_path(manifest_path: str, maybe_rel: str) -> str:
     mp = Path(manifest_path).resolve()
     p = Path(maybe_rel)
 
@@ -59,22 +184,50 @@ def abspath_from_manifest(manifest_path: str | Path, maybe_rel: str | Path) -> s
     return str(cand2)
 
 
+# os.stat() of the files the manifest references, gathered in parallel at the start
+# of apply_manifest(); None marks a missing file.
+_STAT_CACHE: Dict[str, Optional[os.stat_result]] = {}
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _file_stat(path: str) -> Optional[os.stat_result]:
+    """os.stat(path) (None if missing), answered from the per-apply cache when primed."""
+    if path in _STAT_CACHE:
+        return _STAT_CACHE[path]
+    return _stat_or_none(path)
+
+
 # ----------------------------
 # Collection + object plumbing
 # ----------------------------
 
 
+# Top-level collections already ensured during the current apply_manifest() pass.
+_SCENE_COLLECTIONS: Dict[str, bpy.types.Collection] = {}
+
+
 def ensure_collection(name: str) -> bpy.types.Collection:
+    col = _SCENE_COLLECTIONS.get(name)
+    if col is not None:
+        return col
+
     scene = bpy.context.scene
     col = bpy.data.collections.get(name)
     if col is None:
         col = bpy.data.collections.new(name)
-
-    if scene.collection.children.get(col.name) is None:
+        scene.collection.children.link(col)
+    elif scene.collection.children.get(col.name) is None:
         try:
             scene.collection.children.link(col)
         except RuntimeError:
             pass
+    _SCENE_COLLECTIONS[name] = col
     return col
 
 
@@ -84,7 +237,8 @@ def ensure_child_collection(
     col = bpy.data.collections.get(name)
     if col is None:
         col = bpy.data.collections.new(name)
-    if parent.children.get(col.name) is None:
+        parent.children.link(col)
+    elif parent.children.get(col.name) is None:
         try:
             parent.children.link(col)
         except RuntimeError:
@@ -93,17 +247,35 @@ def ensure_child_collection(
 
 
 def move_object_to_collection(obj: bpy.types.Object, col: bpy.types.Collection) -> None:
-    for c in list(obj.users_collection):
+    users = obj.users_collection
+    if len(users) == 1 and users[0] == col:
+        # Already linked to exactly the target collection; nothing to relink.
+        return
+    # Membership comes from the object's (short) users_collection list rather than a
+    # name lookup in col.objects, which is a linear scan over the target collection.
+    # Only the collections to unlink from are snapshotted (unlinking mutates users).
+    stale = [c for c in users if c != col]
+    if len(stale) == len(users):
+        col.objects.link(obj)
+    for c in stale:
         try:
             c.objects.unlink(obj)
         except Exception:
             pass
-    if col.objects.get(obj.name) is None:
-        col.objects.link(obj)
 
 
 def remove_collection_objects(col: bpy.types.Collection) -> None:
-    for obj in list(col.objects):
+    objs = col.objects[:]
+    if not objs:
+        return
+    # One batch_remove() pass instead of an objects.remove() per object, each of
+    # which walks the whole file to clear users of the freed object.
+    try:
+        bpy.data.batch_remove(objs)
+        return
+    except Exception:
+        pass
+    for obj in objs:
         try:
             bpy.data.objects.remove(obj, do_unlink=True)
         except Exception:
@@ -122,14 +294,40 @@ def remove_startup_objects(names: Sequence[str] = ("Cube", "Camera", "Light")) -
             pass
 
 
-def ensure_empty(
-    name: str, location_mm: Sequence[float] = (0.0, 0.0, 0.0)
-) -> bpy.types.Object:
+def _ensure_object(
+    name: str,
+    data: Optional[bpy.types.ID],
+    collection: Optional[bpy.types.Collection] = None,
+) -> Tuple[bpy.types.Object, bool]:
+    """Get or create object `name` using `data`; returns (obj, created).
+
+    New objects are linked once, directly into `collection` (default: the scene
+    collection). Existing objects are moved there and get `data` swapped in if it
+    differs.
+    """
     obj = bpy.data.objects.get(name)
     if obj is None:
-        obj = bpy.data.objects.new(name, None)
+        obj = bpy.data.objects.new(name, data)
+        if collection is None:
+            collection = bpy.context.scene.collection
+        collection.objects.link(obj)
+        return obj, True
+    if collection is not None:
+        move_object_to_collection(obj, collection)
+    if data is not None and obj.data != data:
+        obj.data = data
+    return obj, False
+
+
+def ensure_empty(
+    name: str,
+    location_mm: Sequence[float] = (0.0, 0.0, 0.0),
+    *,
+    collection: Optional[bpy.types.Collection] = None,
+) -> bpy.types.Object:
+    obj, created = _ensure_object(name, None, collection)
+    if created:
         obj.empty_display_type = "PLAIN_AXES"
-        bpy.context.scene.collection.objects.link(obj)
     obj.location = Vector(location_mm)
     return obj
 
@@ -137,21 +335,33 @@ def ensure_empty(
 def ensure_camera(name: str) -> bpy.types.Object:
     obj = bpy.data.objects.get(name)
     if obj is None:
-        cam_data = bpy.data.cameras.new(name + "_DATA")
-        obj = bpy.data.objects.new(name, cam_data)
-        bpy.context.scene.collection.objects.link(obj)
+        obj, _ = _ensure_object(name, bpy.data.cameras.new(name + "_DATA"))
     return obj
 
 
+_DEG2RAD = math.pi / 180.0
+
+
+def euler_from_deg(rotation_deg: Sequence[float]) -> Euler:
+    """XYZ Euler from manifest degrees, without an intermediate list or radians() calls."""
+    rx, ry, rz = rotation_deg
+    return Euler((rx * _DEG2RAD, ry * _DEG2RAD, rz * _DEG2RAD), "XYZ")
+
+
 def set_world_transform(
     obj: bpy.types.Object,
     location_mm: Sequence[float],
     rotation_deg: Sequence[float],
     scale_xyz: Sequence[float],
 ) -> None:
-    obj.location = Vector(location_mm)
-    obj.rotation_euler = Euler([math.radians(v) for v in rotation_deg], "XYZ")
-    obj.scale = Vector(scale_xyz)
+    """Set obj's local location/rotation/scale with a single matrix_basis write.
+
+    Manifest values are already in Blender units (1 BU = 1 mm), so no unit
+    conversion happens here.
+    """
+    obj.matrix_basis = Matrix.LocRotScale(
+        Vector(location_mm), euler_from_deg(rotation_deg), Vector(scale_xyz)
+    )
 
 
 # ----------------------------
@@ -159,17 +369,22 @@ def set_world_transform(
 # ----------------------------
 
 
+# Unit quad on XY centered at the origin: corner positions, loop order and UVs.
+_PLANE_CO = np.array(
+    [-0.5, -0.5, 0.0, 0.5, -0.5, 0.0, 0.5, 0.5, 0.0, -0.5, 0.5, 0.0], dtype=np.float32
+)
+_PLANE_LOOP_VERTS = np.array([0, 1, 2, 3], dtype=np.int32)
+_PLANE_LOOP_START = np.array([0], dtype=np.int32)
+_PLANE_UV = np.array([0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0], dtype=np.float32)
+
+
 def _ensure_plane_uv(mesh: bpy.types.Mesh) -> None:
     """Ensure our generated 1x1 plane has UVs covering [0..1]^2."""
     if mesh.uv_layers:
         return
     uv_layer = mesh.uv_layers.new(name="UVMap")
-    quad_uvs = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
-    for poly in mesh.polygons:
-        if len(poly.loop_indices) != 4:
-            continue
-        for li, uv in zip(poly.loop_indices, quad_uvs):
-            uv_layer.data[li].uv = uv
+    if len(mesh.loops) == 4:
+        uv_layer.data.foreach_set("uv", _PLANE_UV)
 
 
 def ensure_plane_mesh(mesh_name: str) -> bpy.types.Mesh:
@@ -177,14 +392,75 @@ def ensure_plane_mesh(mesh_name: str) -> bpy.types.Mesh:
     mesh = bpy.data.meshes.get(mesh_name)
     if mesh is None:
         mesh = bpy.data.meshes.new(mesh_name)
-        verts = [(-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0)]
-        faces = [(0, 1, 2, 3)]
-        mesh.from_pydata(verts, [], faces)
-        mesh.update()
+        mesh.vertices.add(4)
+        mesh.loops.add(4)
+        mesh.polygons.add(1)
+        mesh.vertices.foreach_set("co", _PLANE_CO)
+        mesh.loops.foreach_set("vertex_index", _PLANE_LOOP_VERTS)
+        mesh.polygons.foreach_set("loop_start", _PLANE_LOOP_START)
+        mesh.update(calc_edges=True)
     _ensure_plane_uv(mesh)
     return mesh
 
 
+# Unit plane shared (as linked object data) by every image plane and guide plane;
+# per-object size lives in obj.scale and materials in object-level slots.
+SHARED_PLANE_MESH_NAME = "SHARED_UNIT_PLANE_MESH"
+
+
+def shared_plane_mesh() -> bpy.types.Mesh:
+    return ensure_plane_mesh(SHARED_PLANE_MESH_NAME)
+
+
+def set_object_material(obj: bpy.types.Object, mat: bpy.types.Material) -> None:
+    """Assign *mat* to the object's first slot, linked to the object, not its data.
+
+    Needed for objects sharing a mesh, so each keeps its own material.
+    """
+    if not obj.material_slots:
+        obj.data.materials.append(None)
+    slot = obj.material_slots[0]
+    if slot.link != "OBJECT":
+        slot.link = "OBJECT"
+    if slot.material != mat:
+        slot.material = mat
+
+
+# Image / font datablocks keyed by the absolute path they were loaded from. These
+# persist across applies; stale entries (datablock removed) are dropped on access.
+_IMAGE_CACHE: Dict[str, bpy.types.Image] = {}
+_FONT_CACHE: Dict[str, bpy.types.VectorFont] = {}
+
+
+def _load_cached(cache: Dict[str, Any], path: str, loader) -> Any:
+    db = cache.get(path)
+    if db is not None:
+        try:
+            db.name  # raises ReferenceError once the datablock has been freed
+            return db
+        except ReferenceError:
+            del cache[path]
+    # check_existing still dedupes against datablocks loaded before the cache existed.
+    db = loader(path, check_existing=True)
+    cache[path] = db
+    return db
+
+
+def load_image_cached(path: str) -> bpy.types.Image:
+    """bpy.data.images.load() with a path-keyed cache in front of Blender's dedupe scan."""
+    return _load_cached(_IMAGE_CACHE, str(path), bpy.data.images.load)
+
+
+def load_font_cached(path: str) -> bpy.types.VectorFont:
+    """bpy.data.fonts.load() with a path-keyed cache in front of Blender's dedupe scan."""
+    return _load_cached(_FONT_CACHE, str(path), bpy.data.fonts.load)
+
+
+# Materials built during the current apply_manifest() pass, keyed by (kind, name, params).
+# Cleared at the start of every apply so edits to the manifest always take effect.
+_MATERIAL_CACHE: Dict[Tuple[Any, ...], bpy.types.Material] = {}
+
+
 def ensure_material_principled(
     name: str,
     *,
@@ -193,6 +469,18 @@ def ensure_material_principled(
     specular: float = 0.2,
     metallic: float = 0.0,
 ) -> bpy.types.Material:
+    key = (
+        "principled",
+        name,
+        tuple(float(c) for c in color_rgba),
+        float(roughness),
+        float(specular),
+        float(metallic),
+    )
+    mat = _MATERIAL_CACHE.get(key)
+    if mat is not None:
+        return mat
+
     mat = bpy.data.materials.get(name)
     if mat is None:
         mat = bpy.data.materials.new(name)
@@ -221,6 +509,7 @@ def ensure_material_principled(
         bsdf.inputs["Specular"].default_value = float(specular)
     if "Metallic" in bsdf.inputs:
         bsdf.inputs["Metallic"].default_value = float(metallic)
+    _MATERIAL_CACHE[key] = mat
     return mat
 
 
@@ -249,6 +538,10 @@ def _set_material_transparency(
             pass
 
 
+# Signature of the node graph a builder last wrote into a material.
+_MATERIAL_SIG_PROP = "_material_sig"
+
+
 def ensure_material_image_emission(
     name: str,
     image_path: str,
@@ -256,9 +549,37 @@ def ensure_material_image_emission(
     emission_strength: float = 1.0,
 ) -> bpy.types.Material:
     """Unlit image material (Emission), with alpha support (Transparent mix)."""
+    key = ("image_emission", name, str(image_path), float(emission_strength))
+    mat = _MATERIAL_CACHE.get(key)
+    if mat is not None:
+        return mat
+
+    # Identifies the node graph built below (not its image/strength values); bump
+    # the version whenever the nodes or links change.
+    sig = "image_emission_v2"
+
     mat = bpy.data.materials.get(name)
     if mat is None:
         mat = bpy.data.materials.new(name)
+    elif mat.get(_MATERIAL_SIG_PROP) == sig and mat.node_tree is not None:
+        # Graph already has the right shape: leave it alone (rebuilding forces a
+        # shader recompile) and only update the inputs that actually changed.
+        nodes = mat.node_tree.nodes
+        tex = nodes.get("Image Texture")
+        emission = nodes.get("Emission")
+        if tex is not None and emission is not None:
+            img = load_image_cached(image_path)
+            if tex.image != img:
+                tex.image = img
+                try:
+                    img.alpha_mode = "STRAIGHT"
+                except Exception:
+                    pass
+            strength = emission.inputs["Strength"]
+            if strength.default_value != float(emission_strength):
+                strength.default_value = float(emission_strength)
+            _MATERIAL_CACHE[key] = mat
+            return mat
     mat.use_nodes = True
 
     nt = mat.node_tree
@@ -276,8 +597,9 @@ def ensure_material_image_emission(
     texcoord.location = (-840, 0)
 
     tex = nodes.new("ShaderNodeTexImage")
+    tex.name = "Image Texture"
     tex.location = (-560, 0)
-    img = bpy.data.images.load(image_path, check_existing=True)
+    img = load_image_cached(image_path)
     tex.image = img
     try:
         img.alpha_mode = "STRAIGHT"
@@ -285,6 +607,7 @@ def ensure_material_image_emission(
         pass
 
     emission = nodes.new("ShaderNodeEmission")
+    emission.name = "Emission"
     emission.location = (-220, 60)
     emission.inputs["Strength"].default_value = float(emission_strength)
 
@@ -309,6 +632,8 @@ def ensure_material_image_emission(
     links.new(mix.outputs["Shader"], out.inputs["Surface"])
 
     _set_material_transparency(mat, method="BLENDED")
+    mat[_MATERIAL_SIG_PROP] = sig
+    _MATERIAL_CACHE[key] = mat
     return mat
 
 
@@ -356,6 +681,12 @@ def poster_dimensions_mm(cfg: Dict[str, Any]) -> Tuple[float, float, float]:
     return w, h, safe_margin_mm
 
 
+# Camera-parented overlays share the same parent-inverse/rotation every apply.
+# Frozen so the shared constants cannot be mutated in place by callers.
+_IDENTITY_4X4 = Matrix.Identity(4).freeze()
+_ZERO_EULER = Euler((0.0, 0.0, 0.0), "XYZ").freeze()
+
+
 def place_on_poster_plane(
     obj: bpy.types.Object,
     cam_obj: bpy.types.Object,
@@ -363,16 +694,18 @@ def place_on_poster_plane(
     poster_xy_mm: Sequence[float],
     z_mm: float,
 ) -> None:
-    obj.parent = cam_obj
-    obj.matrix_parent_inverse = Matrix.Identity(4)
-    obj.location = Vector(
-        (
-            float(poster_xy_mm[0]),
-            float(poster_xy_mm[1]),
-            -plane_distance_mm + float(z_mm),
-        )
+    # Parent with an identity inverse: no camera matrix inversion is needed, and
+    # re-parenting is skipped when the object is already attached to the camera.
+    if obj.parent != cam_obj:
+        obj.parent = cam_obj
+    if obj.matrix_parent_inverse != _IDENTITY_4X4:
+        obj.matrix_parent_inverse = _IDENTITY_4X4
+    obj.location = (
+        float(poster_xy_mm[0]),
+        float(poster_xy_mm[1]),
+        -plane_distance_mm + float(z_mm),
     )
-    obj.rotation_euler = Euler((0.0, 0.0, 0.0), "XYZ")
+    obj.rotation_euler = _ZERO_EULER
 
 
 def poster_ray_dir_cam(
@@ -400,19 +733,22 @@ def place_on_poster_ray(
 ) -> None:
     """Parent obj to camera and place it along the view ray at a given camera distance."""
     obj.parent = cam_obj
-    obj.matrix_parent_inverse = Matrix.Identity(4)
+    obj.matrix_parent_inverse = _IDENTITY_4X4
     d = float(distance_mm)
     if d < 1e-6:
         d = 1e-6
     obj.location = poster_ray_dir_cam(poster_xy_mm, plane_distance_mm) * d
 
 
+_PLUS_Y = Vector((0.0, 1.0, 0.0)).freeze()
+
+
 def _quat_from_view_dir(
     desired_cam_dir_asset: Vector,
     desired_up_asset: Vector,
     actual_cam_dir_parent: Vector,
     *,
-    parent_up: Vector = Vector((0.0, 1.0, 0.0)),
+    parent_up: Vector = _PLUS_Y,
     roll_deg: float = 0.0,
 ) -> "mathutils.Quaternion":
     """Quaternion mapping asset-local vectors into parent space.
@@ -976,6 +1312,7 @@ def apply_cycles_settings(cfg: Dict[str, Any]) -> None:
         return
 
     sc = scene.cycles
+    view_layer = bpy.context.view_layer
 
     def _set(attr: str, value: Any) -> None:
         if hasattr(sc, attr):
@@ -998,7 +1335,7 @@ def apply_cycles_settings(cfg: Dict[str, Any]) -> None:
         use_dn = bool(c["use_denoising"])
         _set("use_denoising", use_dn)
         try:
-            bpy.context.view_layer.cycles.use_denoising = use_dn
+            view_layer.cycles.use_denoising = use_dn
         except Exception:
             pass
 
@@ -1006,7 +1343,7 @@ def apply_cycles_settings(cfg: Dict[str, Any]) -> None:
         den = str(c["denoiser"])
         _set("denoiser", den)
         try:
-            bpy.context.view_layer.cycles.denoiser = den
+            view_layer.cycles.denoiser = den
         except Exception:
             pass
 
@@ -1158,33 +1495,25 @@ def ensure_camera_and_guides(cfg: Dict[str, Any]) -> Tuple[bpy.types.Object, flo
     helpers = ensure_collection("HELPERS")
 
     # Poster reference plane (wireframe, hidden in renders)
-    plane = bpy.data.objects.get("REF_PosterImagePlane")
-    if plane is None:
-        mesh = ensure_plane_mesh("REF_PosterImagePlane_MESH")
-        plane = bpy.data.objects.new("REF_PosterImagePlane", mesh)
-        scene.collection.objects.link(plane)
+    plane, _ = _ensure_object(
+        "REF_PosterImagePlane", shared_plane_mesh(), helpers
+    )
     plane.display_type = "WIRE"
     plane.hide_render = True
-    move_object_to_collection(plane, helpers)
     plane.parent = cam
-    plane.matrix_parent_inverse = Matrix.Identity(4)
+    plane.matrix_parent_inverse = _IDENTITY_4X4
     plane.location = Vector((0.0, 0.0, -d_mm))
-    plane.rotation_euler = Euler((0.0, 0.0, 0.0), "XYZ")
+    plane.rotation_euler = _ZERO_EULER
     plane.scale = Vector((poster_w_mm, poster_h_mm, 1.0))
 
     # Safe area guide
-    safe = bpy.data.objects.get("REF_SafeArea")
-    if safe is None:
-        mesh = ensure_plane_mesh("REF_SafeArea_MESH")
-        safe = bpy.data.objects.new("REF_SafeArea", mesh)
-        scene.collection.objects.link(safe)
+    safe, _ = _ensure_object("REF_SafeArea", shared_plane_mesh(), helpers)
     safe.display_type = "WIRE"
     safe.hide_render = True
-    move_object_to_collection(safe, helpers)
     safe.parent = cam
-    safe.matrix_parent_inverse = Matrix.Identity(4)
+    safe.matrix_parent_inverse = _IDENTITY_4X4
     safe.location = Vector((0.0, 0.0, -d_mm + 0.5))
-    safe.rotation_euler = Euler((0.0, 0.0, 0.0), "XYZ")
+    safe.rotation_euler = _ZERO_EULER
     safe_w = max(1.0, poster_w_mm - 2.0 * safe_margin_mm)
     safe_h = max(1.0, poster_h_mm - 2.0 * safe_margin_mm)
     safe.scale = Vector((safe_w, safe_h, 1.0))
@@ -1197,6 +1526,22 @@ def ensure_camera_and_guides(cfg: Dict[str, Any]) -> Tuple[bpy.types.Object, flo
 # ----------------------------
 
 
+# Name given to Track To constraints managed by the manifest, so they can be found by name.
+_TRACK_TO_NAME = "ManifestTrackTo"
+
+
+def _remove_track_to(obj: bpy.types.Object) -> None:
+    c = obj.constraints.get(_TRACK_TO_NAME)
+    if c is None:
+        # Same fallback as _ensure_track_to: older builds left an unnamed Track To.
+        for cc in obj.constraints:
+            if cc.type == "TRACK_TO":
+                c = cc
+                break
+    if c is not None:
+        obj.constraints.remove(c)
+
+
 def _ensure_track_to(
     obj: bpy.types.Object,
     target: bpy.types.Object,
@@ -1214,13 +1559,16 @@ def _ensure_track_to(
       - 'UP_Y' (camera style: +Y is "up")
       - 'UP_Z'
     """
-    c = None
-    for cc in obj.constraints:
-        if cc.type == "TRACK_TO":
-            c = cc
-            break
+    c = obj.constraints.get(_TRACK_TO_NAME)
     if c is None:
-        c = obj.constraints.new(type="TRACK_TO")
+        # Adopt an unnamed Track To left by older builds before creating a new one.
+        for cc in obj.constraints:
+            if cc.type == "TRACK_TO":
+                c = cc
+                break
+        if c is None:
+            c = obj.constraints.new(type="TRACK_TO")
+        c.name = _TRACK_TO_NAME
     c.target = target
     try:
         c.track_axis = str(track_axis)
@@ -1235,21 +1583,29 @@ def _ensure_track_to(
 def _ensure_area_light(
     name: str, cfg: Dict[str, Any], lights_col: bpy.types.Collection
 ) -> bpy.types.Object:
+    # Versioned via _manifest_entry_hash (_BUILDER_VERSION); tagged with the builder
+    # so a light hash never matches one stored by another builder.
+    entry_hash = _manifest_entry_hash(cfg, "area_light")
     obj = bpy.data.objects.get(name)
     if obj is None:
         light_data = bpy.data.lights.new(name + "_DATA", type="AREA")
-        obj = bpy.data.objects.new(name, light_data)
-        bpy.context.scene.collection.objects.link(obj)
-
-    move_object_to_collection(obj, lights_col)
+        obj, _ = _ensure_object(name, light_data, lights_col)
+    else:
+        move_object_to_collection(obj, lights_col)
+        if (
+            obj.get(_MANIFEST_HASH_PROP) == entry_hash
+            and obj.type == "LIGHT"
+            and obj.data.type == "AREA"
+        ):
+            # Same light config as last apply: skip the RNA writes (each re-tags the
+            # light for the depsgraph and the next render's light upload).
+            return obj
 
     if "location_mm" in cfg:
         obj.location = Vector(cfg["location_mm"])
 
     if "rotation_deg" in cfg:
-        obj.rotation_euler = Euler(
-            [math.radians(v) for v in cfg["rotation_deg"]], "XYZ"
-        )
+        obj.rotation_euler = euler_from_deg(cfg["rotation_deg"])
 
     if "color_rgb" in cfg:
         try:
@@ -1285,6 +1641,7 @@ def _ensure_area_light(
         tgt = ensure_empty(f"EMPTY_Target_{name}", cfg["target_mm"])
         _ensure_track_to(obj, tgt)
 
+    obj[_MANIFEST_HASH_PROP] = entry_hash
     return obj
 
 
@@ -1297,12 +1654,10 @@ def apply_light_rig(cfg: Dict[str, Any]) -> None:
 
     rig = lights_cfg.get("rig", "three_area")
     if rig == "three_area":
-        if lights_cfg.get("key", {}).get("enabled", True):
-            _ensure_area_light("LIGHT_Key", lights_cfg.get("key", {}), lights_col)
-        if lights_cfg.get("fill", {}).get("enabled", True):
-            _ensure_area_light("LIGHT_Fill", lights_cfg.get("fill", {}), lights_col)
-        if lights_cfg.get("rim", {}).get("enabled", True):
-            _ensure_area_light("LIGHT_Rim", lights_cfg.get("rim", {}), lights_col)
+        for role, name in (("key", "LIGHT_Key"), ("fill", "LIGHT_Fill"), ("rim", "LIGHT_Rim")):
+            light_cfg = lights_cfg.get(role, {})
+            if light_cfg.get("enabled", True):
+                _ensure_area_light(name, light_cfg, lights_col)
 
     extras = lights_cfg.get("extras", [])
     if isinstance(extras, list):
@@ -1338,43 +1693,53 @@ def _make_cyclorama_mesh(
 
     seg = max(2, int(segments))
 
-    # Cross-section points (y,z) in mm
-    pts: List[Tuple[float, float]] = []
-    pts.append((-float(floor_depth_mm), 0.0))
-    pts.append((0.0, 0.0))
-
+    # Cross-section points (y,z) in mm: floor edge, floor/curve seam, quarter-circle
+    # arc (excluding its start, which is the seam), top of wall.
     r = float(radius_mm)
-    for i in range(1, seg + 1):
-        t = (math.pi * 0.5) * (i / seg)
-        y = r * math.sin(t)
-        z = r * (1.0 - math.cos(t))
-        pts.append((y, z))
-
-    pts.append((r, r + float(wall_height_mm)))
+    n_pts = seg + 3
+    yz = np.empty((n_pts, 2), dtype=np.float64)
+    yz[0] = (-float(floor_depth_mm), 0.0)
+    yz[1] = (0.0, 0.0)
+    t = (math.pi * 0.5) * (np.arange(1, seg + 1, dtype=np.float64) / seg)
+    yz[2:-1, 0] = r * np.sin(t)
+    yz[2:-1, 1] = r * (1.0 - np.cos(t))
+    yz[-1] = (r, r + float(wall_height_mm))
 
     half_w = float(width_mm) * 0.5
 
-    verts: List[Tuple[float, float, float]] = []
-    for y, z in pts:
-        verts.append((-half_w, y, z))
-        verts.append((half_w, y, z))
+    # Two vertices (left/right edge) per cross-section point.
+    co = np.empty((n_pts, 2, 3), dtype=np.float32)
+    co[:, 0, 0] = -half_w
+    co[:, 1, 0] = half_w
+    co[:, :, 1] = yz[:, 0, None]
+    co[:, :, 2] = yz[:, 1, None]
 
-    faces: List[Tuple[int, int, int, int]] = []
-    for j in range(len(pts) - 1):
-        l0 = 2 * j
-        r0 = 2 * j + 1
-        l1 = 2 * (j + 1)
-        r1 = 2 * (j + 1) + 1
-        faces.append((l0, r0, r1, l1))
+    # One quad (l0, r0, r1, l1) per consecutive pair of cross-section points.
+    n_faces = n_pts - 1
+    base = np.arange(0, 2 * n_faces, 2, dtype=np.int32)
+    loop_verts = np.stack((base, base + 1, base + 3, base + 2), axis=1)
 
+    # Write geometry buffers directly instead of going through from_pydata().
     mesh.clear_geometry()
-    mesh.from_pydata(verts, [], faces)
-    mesh.update()
+    mesh.vertices.add(2 * n_pts)
+    mesh.loops.add(4 * n_faces)
+    mesh.polygons.add(n_faces)
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.foreach_set("vertex_index", loop_verts.ravel())
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, 4 * n_faces, 4, dtype=np.int32)
+    )
+    mesh.update(calc_edges=True)
     return mesh
 
 
 def ensure_backdrop(obj_cfg: Dict[str, Any]) -> bpy.types.Object:
     name = obj_cfg["name"]
+    entry_hash = _manifest_entry_hash(obj_cfg)
+    unchanged = _unchanged_object(name, entry_hash)
+    if unchanged is not None:
+        return unchanged
+
     mesh_name = name + "_MESH"
 
     width_mm = float(obj_cfg.get("width_mm", 6000))
@@ -1392,12 +1757,9 @@ def ensure_backdrop(obj_cfg: Dict[str, Any]) -> bpy.types.Object:
         segments=segments,
     )
 
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        obj = bpy.data.objects.new(name, mesh)
-        bpy.context.scene.collection.objects.link(obj)
-    else:
-        obj.data = mesh
+    obj, _ = _ensure_object(
+        name, mesh, ensure_collection(obj_cfg.get("collection", "WORLD"))
+    )
 
     mat_cfg = obj_cfg.get("material", {})
     color = mat_cfg.get("color_rgba", [1.0, 1.0, 1.0, 1.0])
@@ -1418,6 +1780,7 @@ def ensure_backdrop(obj_cfg: Dict[str, Any]) -> bpy.types.Object:
         obj_cfg.get("scale", [1.0, 1.0, 1.0]),
     )
 
+    obj[_MANIFEST_HASH_PROP] = entry_hash
     return obj
 
 
@@ -1438,6 +1801,14 @@ def _as_xy(v: Any, *, default: Tuple[float, float] = (0.0, 0.0)) -> Tuple[float,
     return default
 
 
+_H_ANCHORS = frozenset(("LEFT", "CENTER", "RIGHT"))
+_V_ANCHORS = frozenset(("BOTTOM", "CENTER", "TOP"))
+
+
+def _anchor_token(v: Any) -> str:
+    return str(v).strip().upper()
+
+
 def _parse_anchor(anchor: Any) -> Tuple[str, str]:
     """Parse an anchor specification into (h_anchor, v_anchor).
 
@@ -1446,25 +1817,36 @@ def _parse_anchor(anchor: Any) -> Tuple[str, str]:
       - ["LEFT"|"CENTER"|"RIGHT", "BOTTOM"|"CENTER"|"TOP"]
     """
     if isinstance(anchor, str):
-        a = anchor.strip().upper()
-        if a in {"TOP", "BOTTOM", "CENTER"}:
+        a = _anchor_token(anchor)
+        if a in _V_ANCHORS:
             return "CENTER", a
-        if a in {"LEFT", "RIGHT"}:
+        if a in _H_ANCHORS:
             return a, "CENTER"
         return "CENTER", "CENTER"
 
     if isinstance(anchor, (list, tuple)) and len(anchor) >= 2:
-        h = str(anchor[0]).strip().upper()
-        v = str(anchor[1]).strip().upper()
-        if h not in {"LEFT", "CENTER", "RIGHT"}:
+        h = _anchor_token(anchor[0])
+        v = _anchor_token(anchor[1])
+        if h not in _H_ANCHORS:
             h = "CENTER"
-        if v not in {"BOTTOM", "CENTER", "TOP"}:
+        if v not in _V_ANCHORS:
             v = "CENTER"
         return h, v
 
     return "CENTER", "CENTER"
 
 
+# Center coordinate along one poster axis for each anchor, as
+# f(half_poster_extent, margin, half_object_extent).
+_ANCHOR_OFFSET = {
+    "LEFT": lambda half, m, half_obj: -half + m + half_obj,
+    "BOTTOM": lambda half, m, half_obj: -half + m + half_obj,
+    "RIGHT": lambda half, m, half_obj: half - m - half_obj,
+    "TOP": lambda half, m, half_obj: half - m - half_obj,
+    "CENTER": lambda half, m, half_obj: 0.0,
+}
+
+
 def _poster_xy_from_anchor(
     *,
     anchor: Any,
@@ -1482,22 +1864,46 @@ def _poster_xy_from_anchor(
     ox, oy = float(offset_mm[0]), float(offset_mm[1])
 
     h_anchor, v_anchor = _parse_anchor(anchor)
+    x = _ANCHOR_OFFSET[h_anchor](half_w, mx, w_mm * 0.5)
+    y = _ANCHOR_OFFSET[v_anchor](half_h, my, h_mm * 0.5)
+    return x + ox, y + oy
 
-    if h_anchor == "LEFT":
-        x = -half_w + mx + (w_mm * 0.5)
-    elif h_anchor == "RIGHT":
-        x = half_w - mx - (w_mm * 0.5)
-    else:
-        x = 0.0
-
-    if v_anchor == "BOTTOM":
-        y = -half_h + my + (h_mm * 0.5)
-    elif v_anchor == "TOP":
-        y = half_h - my - (h_mm * 0.5)
-    else:
-        y = 0.0
 
-    return x + ox, y + oy
+# Ray visibility for overlay planes: seen by the camera only.
+# Blender >= 3.0 exposes these as native Object.visible_* properties; older builds
+# only have the Cycles add-on's obj.cycles_visibility group.
+_OVERLAY_RAY_VISIBILITY: Tuple[Tuple[str, bool], ...] = (
+    ("visible_camera", True),
+    ("visible_diffuse", False),
+    ("visible_glossy", False),
+    ("visible_transmission", False),
+    ("visible_shadow", False),
+    ("visible_volume_scatter", False),
+)
+_OVERLAY_CYCLES_VISIBILITY: Tuple[Tuple[str, bool], ...] = (
+    ("camera", True),
+    ("diffuse", False),
+    ("glossy", False),
+    ("transmission", False),
+    ("shadow", False),
+    ("scatter", False),
+)
+_HAS_NATIVE_RAY_VISIBILITY = "visible_diffuse" in bpy.types.Object.bl_rna.properties
+
+
+def _set_overlay_ray_visibility(obj: bpy.types.Object) -> None:
+    """Apply all overlay visibility flags in one batch (API checked once at import)."""
+    if _HAS_NATIVE_RAY_VISIBILITY:
+        for attr, value in _OVERLAY_RAY_VISIBILITY:
+            setattr(obj, attr, value)
+        return
+    try:
+        obj.visible_shadow = False
+        cv = obj.cycles_visibility
+        for attr, value in _OVERLAY_CYCLES_VISIBILITY:
+            setattr(cv, attr, value)
+    except Exception:
+        pass
 
 
 def ensure_image_plane(
@@ -1543,47 +1949,43 @@ def ensure_image_plane(
          The 'scale' vector (if present) multiplies size_mm.
     """
     name = obj_cfg["name"]
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        mesh = ensure_plane_mesh(name + "_MESH")
-        obj = bpy.data.objects.new(name, mesh)
-        bpy.context.scene.collection.objects.link(obj)
-    else:
-        _ensure_plane_uv(obj.data)
+    img_path = abspath_from_manifest(manifest_path, obj_cfg["image_path"])
+    img_st = _file_stat(img_path)
+    img_mtime = img_st.st_mtime if img_st is not None else None
+    entry_hash = _manifest_entry_hash(
+        obj_cfg,
+        cam_obj.name,
+        poster_plane_distance,
+        poster_w_mm,
+        poster_h_mm,
+        safe_margin_mm,
+        img_mtime,
+    )
+    unchanged = _unchanged_object(name, entry_hash)
+    if unchanged is not None:
+        return unchanged
+
+    obj, _ = _ensure_object(
+        name,
+        shared_plane_mesh(),
+        ensure_collection(obj_cfg.get("collection", "WORLD")),
+    )
 
     # Material
-    img_path = abspath_from_manifest(manifest_path, obj_cfg["image_path"])
     # Also load image datablock now so we can optionally compute aspect ratio.
     img = None
     try:
-        img = bpy.data.images.load(img_path, check_existing=True)
+        img = load_image_cached(img_path)
     except Exception:
         img = None
     strength = float(obj_cfg.get("emission_strength", 1.0))
     mat = ensure_material_image_emission(
         "MAT_" + name, img_path, emission_strength=strength
     )
-    if obj.data.materials:
-        obj.data.materials[0] = mat
-    else:
-        obj.data.materials.append(mat)
+    set_object_material(obj, mat)
 
-    # Overlay objects should not cast shadows
-    try:
-        obj.visible_shadow = False
-    except Exception:
-        pass
-
-    # In Cycles, keep overlay planes from affecting lighting/reflections.
-    try:
-        obj.cycles_visibility.camera = True
-        obj.cycles_visibility.diffuse = False
-        obj.cycles_visibility.glossy = False
-        obj.cycles_visibility.transmission = False
-        obj.cycles_visibility.shadow = False
-        obj.cycles_visibility.scatter = False
-    except Exception:
-        pass
+    # Overlay objects should not cast shadows or affect lighting/reflections.
+    _set_overlay_ray_visibility(obj)
 
     # Placement / sizing
     # 1) Explicit size_mm: [w,h]
@@ -1598,12 +2000,9 @@ def ensure_image_plane(
         )
         mx, my = float(margin_xy[0]), float(margin_xy[1])
 
-        fit_w = bool(obj_cfg.get("fit_width", False)) or (
-            str(obj_cfg.get("fit", "")).upper() == "WIDTH"
-        )
-        fit_h = bool(obj_cfg.get("fit_height", False)) or (
-            str(obj_cfg.get("fit", "")).upper() == "HEIGHT"
-        )
+        fit = obj_cfg.get("fit")
+        fit_w = bool(obj_cfg.get("fit_width", False)) or fit == "WIDTH"
+        fit_h = bool(obj_cfg.get("fit_height", False)) or fit == "HEIGHT"
         keep_aspect = bool(obj_cfg.get("maintain_aspect", True))
 
         # Prefer fit_width if both are set.
@@ -1635,7 +2034,7 @@ def ensure_image_plane(
     w_mm = float(w_mm)
     h_mm = float(h_mm)
 
-    space = str(obj_cfg.get("space", "WORLD")).upper()
+    space = obj_cfg.get("space", "WORLD")
     if space == "POSTER":
         z_mm = float(obj_cfg.get("z_mm", 0.0))
         screen_lock = bool(obj_cfg.get("screen_lock", True))
@@ -1675,21 +2074,8 @@ def ensure_image_plane(
             base_px, base_py = 0.0, 0.0
 
         # Store on-poster layout info for optional overlap checking/debug boxes.
-        try:
-            root["poster_layout_xy_mm"] = (float(base_px), float(base_py))
-            if "layout_size_mm" in obj_cfg:
-                ls = obj_cfg.get("layout_size_mm", [0.0, 0.0])
-                if isinstance(ls, (list, tuple)) and len(ls) >= 2:
-                    root["poster_layout_size_mm"] = (float(ls[0]), float(ls[1]))
-        except Exception:
-            pass
-
-        # Store on-poster layout info for optional overlap checking/debug boxes.
-        try:
-            obj["poster_layout_xy_mm"] = (float(base_px), float(base_py))
-            obj["poster_layout_size_mm"] = (float(w_mm), float(h_mm))
-        except Exception:
-            pass
+        obj["poster_layout_xy_mm"] = (float(base_px), float(base_py))
+        obj["poster_layout_size_mm"] = (float(w_mm), float(h_mm))
 
         px = base_px * f if screen_lock else base_px
         py = base_py * f if screen_lock else base_py
@@ -1701,41 +2087,21 @@ def ensure_image_plane(
         if aim_enabled:
             aim_loc = obj_cfg.get("aim_target_mm", [0.0, 0.0, 0.0])
             aim_name = obj_cfg.get("aim_target_name", f"EMPTY_AimTarget_{name}")
-            tgt = ensure_empty(aim_name, aim_loc)
-            try:
-                tgt.hide_render = True
-                tgt.hide_viewport = True
-            except Exception:
-                pass
-            try:
-                move_object_to_collection(tgt, ensure_collection("HELPERS"))
-            except Exception:
-                pass
+            tgt = ensure_empty(aim_name, aim_loc, collection=ensure_collection("HELPERS"))
+            tgt.hide_render = True
+            tgt.hide_viewport = True
 
             track_axis = str(obj_cfg.get("aim_track_axis", "TRACK_NEGATIVE_Z"))
             up_axis = str(obj_cfg.get("aim_up_axis", "UP_Y"))
             _ensure_track_to(obj, tgt, track_axis=track_axis, up_axis=up_axis)
         else:
-            # Determinism: if the user removes aim_* keys, remove existing Track To constraints.
-            try:
-                for c in list(obj.constraints):
-                    if c.type == "TRACK_TO":
-                        obj.constraints.remove(c)
-            except Exception:
-                pass
+            # Determinism: if the user removes aim_* keys, remove the managed Track To.
+            _remove_track_to(obj)
 
     else:
         # WORLD space (unparent + place)
-        try:
-            obj.parent = None
-        except Exception:
-            pass
-        try:
-            for c in list(obj.constraints):
-                if c.type == "TRACK_TO":
-                    obj.constraints.remove(c)
-        except Exception:
-            pass
+        obj.parent = None
+        _remove_track_to(obj)
 
         loc = obj_cfg.get("location_mm", [0.0, 0.0, 0.0])
         rot = obj_cfg.get("rotation_deg", [0.0, 0.0, 0.0])
@@ -1744,27 +2110,68 @@ def ensure_image_plane(
 
         set_world_transform(obj, loc, rot, scale_xyz)
 
-        # Clear poster layout custom props if present.
-        try:
-            if "poster_layout_xy_mm" in obj:
-                del obj["poster_layout_xy_mm"]
-            if "poster_layout_size_mm" in obj:
-                del obj["poster_layout_size_mm"]
-        except Exception:
-            pass
+        _clear_poster_layout_props(obj)
 
+    obj[_MANIFEST_HASH_PROP] = entry_hash
     return obj
 
 
+def _clear_poster_layout_props(obj: bpy.types.Object) -> None:
+    """Drop poster_layout_* custom props (object is no longer placed in POSTER space)."""
+    for key in ("poster_layout_xy_mm", "poster_layout_size_mm"):
+        if key in obj:
+            del obj[key]
+
+
 # ----------------------------
 # Asset import (GLB / WRL)
 # ----------------------------
 
 
-def _import_objects_and_get_new(import_op) -> List[bpy.types.Object]:
-    before = {o.as_pointer() for o in bpy.data.objects}
-    import_op()
-    return [o for o in bpy.data.objects if o.as_pointer() not in before]
+def _find_layer_collection(
+    layer_col: bpy.types.LayerCollection, col: bpy.types.Collection
+) -> Optional[bpy.types.LayerCollection]:
+    if layer_col.collection == col:
+        return layer_col
+    for child in layer_col.children:
+        found = _find_layer_collection(child, col)
+        if found is not None:
+            return found
+    return None
+
+
+def _import_objects_and_get_new(
+    import_op, target_col: bpy.types.Collection
+) -> Tuple[List[bpy.types.Object], set]:
+    """Run import_op into the (empty) *target_col*; return (new_objects, pointers).
+
+    target_col is made the active collection while the importer runs, so the glTF
+    and X3D importers link new objects straight into it and they can be read back
+    from it, without snapshotting every object in the file before and after.
+    Importers that link elsewhere are covered by their selection instead (both
+    importers select what they create).
+    """
+    view_layer = bpy.context.view_layer
+    prev_active = view_layer.active_layer_collection
+    target_layer = _find_layer_collection(view_layer.layer_collection, target_col)
+    for o in bpy.context.selected_objects:
+        o.select_set(False)
+    if target_layer is not None:
+        view_layer.active_layer_collection = target_layer
+    try:
+        import_op()
+    finally:
+        view_layer.active_layer_collection = prev_active
+
+    new_objs = list(target_col.all_objects)
+    if not new_objs:
+        new_objs = list(bpy.context.selected_objects)
+    return new_objs, {o.as_pointer() for o in new_objs}
+
+
+# Custom property on an imported asset's root: importer, path, mtime and size of the
+# source file it was imported from.
+_ASSET_KEY_PROP = "_asset_key"
 
 
 def ensure_imported_asset(
@@ -1782,32 +2189,39 @@ def ensure_imported_asset(
     helpers_col = ensure_collection("HELPERS")
 
     # Stable root empty
-    root = bpy.data.objects.get(name)
-    if root is None:
-        root = bpy.data.objects.new(name, None)
+    root, created = _ensure_object(name, None, helpers_col)
+    if created:
         root.empty_display_type = "PLAIN_AXES"
-        bpy.context.scene.collection.objects.link(root)
     root.hide_render = True
-    move_object_to_collection(root, helpers_col)
 
     desired_loc = obj_cfg.get("location_mm", [0.0, 0.0, 0.0])
     desired_rot = obj_cfg.get("rotation_deg", [0.0, 0.0, 0.0])
     desired_scale = obj_cfg.get("scale", [1.0, 1.0, 1.0])
     import_scale = float(obj_cfg.get("import_scale", 1.0))
+    combined_scale = Vector(desired_scale) * import_scale
+
+    filepath = abspath_from_manifest(manifest_path, obj_cfg["filepath"])
+    st = _file_stat(filepath)
+    if st is None:
+        raise FileNotFoundError(f"Asset file not found: {filepath}")
+
+    # Reuse the previous import when the source file is unchanged; only the root
+    # transform needs updating.
+    asset_key = f"{importer}:{filepath}:{st.st_mtime_ns}:{st.st_size}"
+    if root.get(_ASSET_KEY_PROP) == asset_key and len(asset_col.all_objects) > 0:
+        root.parent = None
+        set_world_transform(root, desired_loc, desired_rot, combined_scale)
+        return root
 
     # Identity root during parenting
     root.parent = None
     root.location = Vector((0.0, 0.0, 0.0))
-    root.rotation_euler = Euler((0.0, 0.0, 0.0), "XYZ")
+    root.rotation_euler = _ZERO_EULER
     root.scale = Vector((1.0, 1.0, 1.0))
 
     # Clear prior import
     remove_collection_objects(asset_col)
 
-    filepath = abspath_from_manifest(manifest_path, obj_cfg["filepath"])
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"Asset file not found: {filepath}")
-
     if importer == "glb":
 
         def op():
@@ -1821,38 +2235,31 @@ def ensure_imported_asset(
     else:
         raise ValueError(f"Unknown importer: {importer}")
 
-    new_objs = _import_objects_and_get_new(op)
-
-    # Move imported objects into asset collection (preserve hierarchy)
-    for o in new_objs:
-        if o.type in {"CAMERA", "LIGHT"}:
-            continue
-        move_object_to_collection(o, asset_col)
+    new_objs, new_ptrs = _import_objects_and_get_new(op, asset_col)
 
-    # Parent only top-level imported objects to root, preserving transforms
-    new_ptrs = {o.as_pointer() for o in new_objs}
+    # Move imported objects into asset collection (preserve hierarchy) and collect
+    # the top-level ones (parent is None or was not part of this import).
     top_level: List[bpy.types.Object] = []
     for o in new_objs:
         if o.type in {"CAMERA", "LIGHT"}:
             continue
-        if o.parent is None:
+        move_object_to_collection(o, asset_col)
+        p = o.parent
+        if p is None or p.as_pointer() not in new_ptrs:
             top_level.append(o)
-        else:
-            try:
-                if o.parent.as_pointer() not in new_ptrs:
-                    top_level.append(o)
-            except Exception:
-                top_level.append(o)
 
+    # Parent only top-level imported objects to root, preserving transforms. The
+    # root is at identity here, so its inverse is too (and root.matrix_world may not
+    # have been re-evaluated since it was reset above).
     for o in top_level:
         mw = o.matrix_world.copy()
         o.parent = root
-        o.matrix_parent_inverse = root.matrix_world.inverted()
+        o.matrix_parent_inverse = _IDENTITY_4X4
         o.matrix_world = mw
 
     # Apply final transform to root (include import_scale)
-    combined_scale = Vector(desired_scale) * import_scale
     set_world_transform(root, desired_loc, desired_rot, combined_scale)
+    root[_ASSET_KEY_PROP] = asset_key
     return root
 
 
@@ -1875,12 +2282,9 @@ def ensure_text_object(
     if curve is None:
         curve = bpy.data.curves.new(name + "_FONT", type="FONT")
 
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        obj = bpy.data.objects.new(name, curve)
-        bpy.context.scene.collection.objects.link(obj)
-    else:
-        obj.data = curve
+    obj, _ = _ensure_object(
+        name, curve, ensure_collection(obj_cfg.get("collection", "WORLD"))
+    )
 
     curve.body = obj_cfg.get("text", "")
     style_name = str(obj_cfg.get("style", ""))
@@ -1903,11 +2307,14 @@ def ensure_text_object(
     font_rel = obj_cfg.get("font", style.get("font"))
     if font_rel:
         font_path = abspath_from_manifest(manifest_path, font_rel)
-        if os.path.exists(font_path):
+        font = None
+        if _file_stat(font_path) is not None:
             try:
-                curve.font = bpy.data.fonts.load(font_path, check_existing=True)
+                font = load_font_cached(font_path)
             except Exception:
-                pass
+                font = None
+        if font is not None:
+            curve.font = font
 
     rgba = obj_cfg.get("color_rgba", style.get("color_rgba"))
     if rgba:
@@ -1926,36 +2333,24 @@ def ensure_text_object(
         else:
             obj.data.materials.append(mat)
 
-    space = str(obj_cfg.get("space", "WORLD")).upper()
+    space = obj_cfg.get("space", "WORLD")
     if space == "POSTER":
         # Store optional layout info for overlap checking/debug boxes.
-        try:
-            obj["poster_layout_xy_mm"] = (
-                float(obj_cfg.get("poster_xy_mm", [0.0, 0.0])[0]),
-                float(obj_cfg.get("poster_xy_mm", [0.0, 0.0])[1]),
-            )
-            if "layout_size_mm" in obj_cfg:
-                ls = obj_cfg.get("layout_size_mm", [0.0, 0.0])
-                if isinstance(ls, (list, tuple)) and len(ls) >= 2:
-                    obj["poster_layout_size_mm"] = (float(ls[0]), float(ls[1]))
-        except Exception:
-            pass
+        poster_xy = obj_cfg.get("poster_xy_mm", [0.0, 0.0])
+        obj["poster_layout_xy_mm"] = (float(poster_xy[0]), float(poster_xy[1]))
+        if "layout_size_mm" in obj_cfg:
+            ls = obj_cfg.get("layout_size_mm", [0.0, 0.0])
+            if isinstance(ls, (list, tuple)) and len(ls) >= 2:
+                obj["poster_layout_size_mm"] = (float(ls[0]), float(ls[1]))
         place_on_poster_plane(
             obj,
             cam_obj,
             poster_plane_distance,
-            obj_cfg.get("poster_xy_mm", [0.0, 0.0]),
+            poster_xy,
             float(obj_cfg.get("z_mm", 0.0)),
         )
     else:
-        # Clear poster layout props if present.
-        try:
-            if "poster_layout_xy_mm" in obj:
-                del obj["poster_layout_xy_mm"]
-            if "poster_layout_size_mm" in obj:
-                del obj["poster_layout_size_mm"]
-        except Exception:
-            pass
+        _clear_poster_layout_props(obj)
         set_world_transform(
             obj,
             obj_cfg.get("location_mm", [0.0, 0.0, 0.0]),
@@ -1971,16 +2366,29 @@ def ensure_text_object(
 # ----------------------------
 
 
+# Collection names per resolved .blend path, for the current apply_manifest() pass.
+_BLEND_COLL_LIST_CACHE: Dict[str, List[str]] = {}
+
+
 def _list_collections_in_blend(blend_path: str, *, link: bool = True) -> List[str]:
     blend_path = str(Path(blend_path).resolve())
+    cached = _BLEND_COLL_LIST_CACHE.get(blend_path)
+    if cached is not None:
+        return cached
     with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
-        return list(getattr(data_from, "collections", []))
+        names = list(getattr(data_from, "collections", []))
+    _BLEND_COLL_LIST_CACHE[blend_path] = names
+    return names
 
 
 def _load_collection_from_blend(
     blend_path: str, collection_name: str, *, link: bool
 ) -> Optional[bpy.types.Collection]:
     blend_path = str(Path(blend_path).resolve())
+    # Skip opening the library when we already know the collection isn't there.
+    cached = _BLEND_COLL_LIST_CACHE.get(blend_path)
+    if cached is not None and collection_name not in cached:
+        return None
     with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
         if collection_name not in getattr(data_from, "collections", []):
             return None
@@ -1988,19 +2396,12 @@ def _load_collection_from_blend(
     return data_to.collections[0]
 
 
-def load_collection_from_blend(
-    blend_path: str,
-    *,
-    collection_name: Optional[str] = None,
-    fallback_names: Sequence[str] = (),
-    link: bool = True,
-) -> bpy.types.Collection:
-    """Load a Collection datablock from an external .blend file, with robust fallbacks."""
-    blend_path = str(Path(blend_path).resolve())
-    available = _list_collections_in_blend(blend_path, link=link)
-    if not available:
-        raise RuntimeError(f"No collections found in blend library: {blend_path}")
-
+def _collection_candidates(
+    available: Sequence[str],
+    collection_name: Optional[str],
+    fallback_names: Sequence[str],
+) -> List[str]:
+    """Ordered collection names to try, restricted to those present in the library."""
     candidates: List[str] = []
     if collection_name:
         candidates.append(str(collection_name))
@@ -2019,24 +2420,57 @@ def load_collection_from_blend(
         if n not in candidates:
             candidates.append(n)
 
+    present = set(available)
+    return [n for n in candidates if n in present]
+
+
+def load_collection_from_blend(
+    blend_path: str,
+    *,
+    collection_name: Optional[str] = None,
+    fallback_names: Sequence[str] = (),
+    link: bool = True,
+) -> bpy.types.Collection:
+    """Load a Collection datablock from an external .blend file, with robust fallbacks.
+
+    The library is opened once to both list its collections and load the preferred
+    candidate. Further candidates are only loaded if that one turns out to be empty.
+    """
+    blend_path = str(Path(blend_path).resolve())
+    with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
+        available = list(getattr(data_from, "collections", []))
+        _BLEND_COLL_LIST_CACHE[blend_path] = available
+        candidates = _collection_candidates(available, collection_name, fallback_names)
+        if candidates:
+            data_to.collections = [candidates[0]]
+    if not available:
+        raise RuntimeError(f"No collections found in blend library: {blend_path}")
+
     picked = None
     picked_name = None
-    for cand in candidates:
-        coll = _load_collection_from_blend(blend_path, cand, link=link)
-        if coll is None:
-            continue
-        # Prefer non-empty
+    if candidates and data_to.collections and data_to.collections[0] is not None:
+        picked = data_to.collections[0]
+        picked_name = candidates[0]
+
+    def _n_objs(coll: bpy.types.Collection) -> int:
         try:
-            n_objs = len(getattr(coll, "all_objects", []))
+            return len(getattr(coll, "all_objects", []))
         except Exception:
-            n_objs = 0
-        if n_objs > 0:
-            picked = coll
-            picked_name = cand
-            break
-        if picked is None:
-            picked = coll
-            picked_name = cand
+            return 0
+
+    # Prefer non-empty
+    if picked is None or _n_objs(picked) == 0:
+        for cand in candidates[1:]:
+            coll = _load_collection_from_blend(blend_path, cand, link=link)
+            if coll is None:
+                continue
+            if _n_objs(coll) > 0:
+                picked = coll
+                picked_name = cand
+                break
+            if picked is None:
+                picked = coll
+                picked_name = cand
 
     if picked is None:
         raise RuntimeError(f"Failed to load any collection from {blend_path}")
@@ -2102,18 +2536,14 @@ def ensure_imported_blend_asset(
     remove_collection_objects(asset_col)
 
     # Root transform handle (kept with the asset so hiding HELPERS doesn't hide the asset)
-    root = ensure_empty(name, [0.0, 0.0, 0.0])
+    root = ensure_empty(name, [0.0, 0.0, 0.0], collection=asset_col)
     # Empties do not render; avoid disabling render (can hide children in some setups).
-    try:
-        root.hide_render = False
-    except Exception:
-        pass
-    move_object_to_collection(root, asset_col)
+    root.hide_render = False
 
     blend_path = abspath_from_manifest(
         manifest_path, obj_cfg.get("filepath", obj_cfg.get("path", ""))
     )
-    if not os.path.exists(blend_path):
+    if _file_stat(blend_path) is None:
         raise FileNotFoundError(f"Blend asset file not found: {blend_path}")
     requested = obj_cfg.get("blend_collection", None)
     link = bool(obj_cfg.get("link", True))
@@ -2222,18 +2652,16 @@ def ensure_imported_blend_asset(
             pass
 
     inst = bpy.data.objects.new(inst_name, None)
-    bpy.context.scene.collection.objects.link(inst)
-    move_object_to_collection(inst, asset_col)
+    asset_col.objects.link(inst)
 
     inst.empty_display_type = "PLAIN_AXES"
     inst.instance_type = "COLLECTION"
     inst.instance_collection = coll
 
     inst.parent = root
-    try:
-        inst.matrix_parent_inverse = root.matrix_world.inverted()
-    except Exception:
-        pass
+    # root is reused from the last apply, so its matrix_world can still carry a zero
+    # scale from the manifest; inverted() would raise on that singular matrix.
+    inst.matrix_parent_inverse = root.matrix_world.inverted_safe()
 
     sc = obj_cfg.get("scale", [1.0, 1.0, 1.0])
     import_scale = float(obj_cfg.get("import_scale", 1.0))
@@ -2243,7 +2671,7 @@ def ensure_imported_blend_asset(
         float(sc[2]) * import_scale,
     ]
 
-    space = str(obj_cfg.get("space", "WORLD")).upper()
+    space = obj_cfg.get("space", "WORLD")
     if space == "POSTER":
         if cam_obj is None or poster_plane_distance is None:
             raise ValueError(
@@ -2252,7 +2680,7 @@ def ensure_imported_blend_asset(
 
         # Parent the root to the poster camera so poster coordinates remain stable.
         root.parent = cam_obj
-        root.matrix_parent_inverse = Matrix.Identity(4)
+        root.matrix_parent_inverse = _IDENTITY_4X4
 
         # Placement target on poster
         if "poster_xy_mm" in obj_cfg:
@@ -2304,7 +2732,7 @@ def ensure_imported_blend_asset(
         #   view: { "target_mode": "BOUNDS_CENTER", ... }
         #   view: { "target_object_name": "RIG_SOMETHING_ROOT", ... }
         if isinstance(view_cfg, dict):
-            mode = str(view_cfg.get("target_mode", "")).upper()
+            mode = view_cfg.get("target_mode", "")
             if mode in ("BOUNDS_CENTER", "MESH_BOUNDS_CENTER", "MESH_CENTER"):
                 target_asset = _collection_mesh_bounds_center(coll)
             else:
@@ -2334,15 +2762,12 @@ def ensure_imported_blend_asset(
                 ref_d = 1e-6
             k = float(dist_mm) / ref_d
             sc2_eff = [float(sc2[0]) * k, float(sc2[1]) * k, float(sc2[2]) * k]
-        try:
-            root["appearance_distance_mm"] = float(
-                obj_cfg.get(
-                    "appearance_distance_mm",
-                    float(dist_mm) if dist_mm is not None else 0.0,
-                )
+        root["appearance_distance_mm"] = float(
+            obj_cfg.get(
+                "appearance_distance_mm",
+                float(dist_mm) if dist_mm is not None else 0.0,
             )
-        except Exception:
-            pass
+        )
 
         # Desired location (in *camera local space*) for the TARGET point on the poster ray/plane.
         if dist_mm is not None:
@@ -2367,14 +2792,11 @@ def ensure_imported_blend_asset(
             )
 
         # Store on-poster layout info for optional overlap checking/debug boxes.
-        try:
-            root["poster_layout_xy_mm"] = (float(base_px), float(base_py))
-            if "layout_size_mm" in obj_cfg:
-                ls = obj_cfg.get("layout_size_mm", [0.0, 0.0])
-                if isinstance(ls, (list, tuple)) and len(ls) >= 2:
-                    root["poster_layout_size_mm"] = (float(ls[0]), float(ls[1]))
-        except Exception:
-            pass
+        root["poster_layout_xy_mm"] = (float(base_px), float(base_py))
+        if "layout_size_mm" in obj_cfg:
+            ls = obj_cfg.get("layout_size_mm", [0.0, 0.0])
+            if isinstance(ls, (list, tuple)) and len(ls) >= 2:
+                root["poster_layout_size_mm"] = (float(ls[0]), float(ls[1]))
 
         # Orientation (virtual-camera view)
         view_dir = parsed_view_dir
@@ -2407,12 +2829,12 @@ def ensure_imported_blend_asset(
                 desired_cam_dir_asset,
                 desired_up_asset,
                 actual_cam_dir_parent,
-                parent_up=Vector((0.0, 1.0, 0.0)),
+                parent_up=_PLUS_Y,
                 roll_deg=view_roll,
             )
 
             # Optional extra local rotation (still supported, but try to prefer view.roll_deg)
-            q_off = Euler([math.radians(v) for v in rot_deg], "XYZ").to_quaternion()
+            q_off = euler_from_deg(rot_deg).to_quaternion()
             q_final = q_view @ q_off
 
             try:
@@ -2426,7 +2848,7 @@ def ensure_imported_blend_asset(
                 root.rotation_mode = "XYZ"
             except Exception:
                 pass
-            e = Euler([math.radians(v) for v in rot_deg], "XYZ")
+            e = euler_from_deg(rot_deg)
             root.rotation_euler = e
             q_final = e.to_quaternion()
 
@@ -2471,19 +2893,8 @@ def ensure_imported_blend_asset(
 
     else:
         # WORLD space placement (default)
-        try:
-            root.parent = None
-        except Exception:
-            pass
-
-        # Clear poster layout custom props if present.
-        try:
-            if "poster_layout_xy_mm" in root:
-                del root["poster_layout_xy_mm"]
-            if "poster_layout_size_mm" in root:
-                del root["poster_layout_size_mm"]
-        except Exception:
-            pass
+        root.parent = None
+        _clear_poster_layout_props(root)
 
         loc = obj_cfg.get("location_mm", [0.0, 0.0, 0.0])
         rot = obj_cfg.get("rotation_deg", [0.0, 0.0, 0.0])
@@ -2557,11 +2968,7 @@ def _ensure_layout_box_plane(
 ) -> bpy.types.Object:
     """Create a non-rendering wireframe plane showing a reserved layout box."""
     obj_name = f"LAYOUTBOX_{name}"
-    obj = bpy.data.objects.get(obj_name)
-    if obj is None:
-        mesh = ensure_plane_mesh(obj_name + "_MESH")
-        obj = bpy.data.objects.new(obj_name, mesh)
-        bpy.context.scene.collection.objects.link(obj)
+    obj, _ = _ensure_object(obj_name, shared_plane_mesh(), ensure_collection("HELPERS"))
 
     obj.display_type = "WIRE"
     obj.hide_render = True
@@ -2580,10 +2987,6 @@ def _ensure_layout_box_plane(
         [float(center_xy_mm[0]), float(center_xy_mm[1])],
         float(z_mm),
     )
-    try:
-        move_object_to_collection(obj, ensure_collection("HELPERS"))
-    except Exception:
-        pass
     return obj
 
 
@@ -2659,82 +3062,206 @@ def run_layout_diagnostics(
 # ----------------------------
 
 
+_ASSET_FILE_KINDS = frozenset(
+    ("import_glb", "import_wrl", "import_blend", "instance_blend_collection")
+)
+
+
+def _read_and_discard(path: str, chunk_size: int = 1 << 20) -> None:
+    try:
+        with open(path, "rb") as f:
+            while f.read(chunk_size):
+                pass
+    except OSError:
+        pass
+
+
+def _prefetch_asset_files(
+    cfg: Dict[str, Any], manifest_path: str | Path
+) -> Optional[ThreadPoolExecutor]:
+    """Warm the OS page cache for asset files on worker threads.
+
+    Imports/library loads must stay on Blender's main thread, but reading the files
+    ahead of time overlaps their disk (or network share) I/O with the rest of the
+    apply. Returns the executor so the caller can shut it down without waiting.
+    """
+    paths: List[str] = []
+    for obj_cfg in cfg.get("objects", []):
+        if not obj_cfg.get("enabled", True):
+            continue
+        if obj_cfg.get("kind") not in _ASSET_FILE_KINDS:
+            continue
+        rel = obj_cfg.get("filepath", obj_cfg.get("path", ""))
+        if not rel:
+            continue
+        p = abspath_from_manifest(manifest_path, rel)
+        if p not in paths:
+            paths.append(p)
+    if not paths:
+        return None
+
+    pool = ThreadPoolExecutor(max_workers=min(4, len(paths)))
+    for p in paths:
+        pool.submit(_read_and_discard, p)
+    return pool
+
+
+# Scene custom property: fingerprint of every input the last complete apply used.
+_APPLY_FINGERPRINT_PROP = "_apply_fingerprint"
+
+
+def _referenced_file_paths(cfg: Dict[str, Any], manifest_path: str | Path) -> List[str]:
+    """Absolute paths of every image, font and asset file the manifest refers to.
+
+    Path resolution and os.stat() (both blocking syscalls, slow on network shares)
+    run on a thread pool; the stat results prime _STAT_CACHE for the builders.
+    """
+    rels: List[str] = []
+    for style in (cfg.get("styles") or {}).values():
+        if isinstance(style, dict) and style.get("font"):
+            rels.append(style["font"])
+    for obj_cfg in cfg.get("objects", []):
+        if not obj_cfg.get("enabled", True):
+            continue
+        for key in ("image_path", "font", "filepath", "path"):
+            rel = obj_cfg.get(key)
+            if isinstance(rel, str) and rel:
+                rels.append(rel)
+    rels = list(dict.fromkeys(rels))
+
+    def resolve_and_stat(rel: str) -> Tuple[str, Optional[os.stat_result]]:
+        p = abspath_from_manifest(manifest_path, rel)
+        return p, _stat_or_none(p)
+
+    _STAT_CACHE.clear()
+    if rels:
+        with ThreadPoolExecutor(max_workers=min(16, len(rels))) as pool:
+            _STAT_CACHE.update(pool.map(resolve_and_stat, rels))
+    return sorted(_STAT_CACHE)
+
+
+def _apply_fingerprint(cfg: Dict[str, Any], manifest_path: str | Path) -> str:
+    """Hash of the manifest bytes, this module and the stat of every referenced file."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(Path(manifest_path).resolve().read_bytes())
+    for p in [os.path.abspath(__file__)] + _referenced_file_paths(cfg, manifest_path):
+        st = _file_stat(p)
+        stamp = f"{p}:{st.st_mtime_ns}:{st.st_size}" if st is not None else f"{p}:missing"
+        h.update(stamp.encode("utf-8"))
+    return h.hexdigest()
+
+
+def manifest_fingerprint(manifest_path: str | Path) -> str:
+    """Fingerprint of every input apply_manifest() reads (see _apply_fingerprint)."""
+    return _apply_fingerprint(load_manifest(manifest_path), manifest_path)
+
+
 def apply_manifest(
     manifest_path: str | Path, *, ppi_override: Optional[float] = None
 ) -> Dict[str, Any]:
+    """Build/update the scene from the manifest.
+
+    If the scene was last built by a complete apply from identical inputs (see
+    _apply_fingerprint), only the scene-level settings are re-applied (callers such
+    as render.py override those afterwards); cameras, lights and objects are left
+    untouched.
+    """
     cfg = load_manifest(manifest_path)
+    _resolve_manifest_path.cache_clear()
+    scene = bpy.context.scene
+    fingerprint = _apply_fingerprint(cfg, manifest_path)
+    unchanged = (
+        scene.get(_APPLY_FINGERPRINT_PROP) == fingerprint and scene.camera is not None
+    )
+    if not unchanged and _APPLY_FINGERPRINT_PROP in scene:
+        # A full apply that fails part-way must not leave the old fingerprint behind.
+        del scene[_APPLY_FINGERPRINT_PROP]
 
-    if bool(cfg.get("scene", {}).get("remove_startup_objects", True)):
-        remove_startup_objects()
+    _MATERIAL_CACHE.clear()
+    _BLEND_COLL_LIST_CACHE.clear()
+    _SCENE_COLLECTIONS.clear()
+    prefetch = None if unchanged else _prefetch_asset_files(cfg, manifest_path)
 
-    ensure_collection("WORLD")
-    ensure_collection("OVERLAY")
-    ensure_collection("HELPERS")
-    ensure_collection("LIGHTS")
+    # The prefetch pool must be shut down even if a builder raises.
+    try:
+        if bool(cfg.get("scene", {}).get("remove_startup_objects", True)):
+            remove_startup_objects()
+
+        ensure_collection("WORLD")
+        ensure_collection("OVERLAY")
+        ensure_collection("HELPERS")
+        ensure_collection("LIGHTS")
+
+        apply_units(cfg)
+        apply_world_settings(cfg)
+
+        poster_w_mm, poster_h_mm, _safe_margin_mm = poster_dimensions_mm(cfg)
+        apply_render_settings(
+            cfg,
+            poster_width_in=(poster_w_mm / 25.4),
+            poster_height_in=(poster_h_mm / 25.4),
+            ppi_override=ppi_override,
+        )
 
-    apply_units(cfg)
-    apply_world_settings(cfg)
+        if unchanged:
+            print("[apply] Manifest and referenced files unchanged; scene content kept")
+            return cfg
 
-    poster_w_mm, poster_h_mm, _safe_margin_mm = poster_dimensions_mm(cfg)
-    apply_render_settings(
-        cfg,
-        poster_width_in=(poster_w_mm / 25.4),
-        poster_height_in=(poster_h_mm / 25.4),
-        ppi_override=ppi_override,
-    )
+        cam, plane_d_mm = ensure_camera_and_guides(cfg)
+        apply_light_rig(cfg)
 
-    cam, plane_d_mm = ensure_camera_and_guides(cfg)
-    apply_light_rig(cfg)
+        # Build objects
+        styles = cfg.get("styles", {})
+        for obj_cfg in cfg.get("objects", []):
+            if not obj_cfg.get("enabled", True):
+                continue
 
-    # Build objects
-    for obj_cfg in cfg.get("objects", []):
-        if not obj_cfg.get("enabled", True):
-            continue
+            # Builders link new objects straight into obj_cfg["collection"] (default WORLD).
+            kind = obj_cfg.get("kind")
+
+            if kind == "text":
+                ensure_text_object(obj_cfg, manifest_path, styles, cam, plane_d_mm)
+
+            elif kind == "image_plane":
+                ensure_image_plane(
+                    obj_cfg,
+                    manifest_path,
+                    cam,
+                    plane_d_mm,
+                    poster_w_mm=poster_w_mm,
+                    poster_h_mm=poster_h_mm,
+                    safe_margin_mm=_safe_margin_mm,
+                )
 
-        kind = obj_cfg.get("kind")
-        collection_name = obj_cfg.get("collection", "WORLD")
-        col = ensure_collection(collection_name)
-
-        if kind == "text":
-            styles = cfg.get("styles", {})
-            obj = ensure_text_object(obj_cfg, manifest_path, styles, cam, plane_d_mm)
-            move_object_to_collection(obj, col)
-
-        elif kind == "image_plane":
-            obj = ensure_image_plane(
-                obj_cfg,
-                manifest_path,
-                cam,
-                plane_d_mm,
-                poster_w_mm=poster_w_mm,
-                poster_h_mm=poster_h_mm,
-                safe_margin_mm=_safe_margin_mm,
-            )
-            move_object_to_collection(obj, col)
+            elif kind == "backdrop":
+                ensure_backdrop(obj_cfg)
 
-        elif kind == "backdrop":
-            obj = ensure_backdrop(obj_cfg)
-            move_object_to_collection(obj, col)
+            elif kind == "import_glb":
+                ensure_imported_asset(obj_cfg, manifest_path, importer="glb")
 
-        elif kind == "import_glb":
-            ensure_imported_asset(obj_cfg, manifest_path, importer="glb")
+            elif kind == "import_wrl":
+                ensure_imported_asset(obj_cfg, manifest_path, importer="wrl")
 
-        elif kind == "import_wrl":
-            ensure_imported_asset(obj_cfg, manifest_path, importer="wrl")
+            elif kind in ("import_blend", "instance_blend_collection"):
+                ensure_imported_blend_asset(
+                    obj_cfg,
+                    manifest_path,
+                    cam_obj=cam,
+                    poster_plane_distance=plane_d_mm,
+                    poster_w_mm=poster_w_mm,
+                    poster_h_mm=poster_h_mm,
+                    safe_margin_mm=_safe_margin_mm,
+                )
 
-        elif kind in ("import_blend", "instance_blend_collection"):
-            ensure_imported_blend_asset(
-                obj_cfg,
-                manifest_path,
-                cam_obj=cam,
-                poster_plane_distance=plane_d_mm,
-                poster_w_mm=poster_w_mm,
-                poster_h_mm=poster_h_mm,
-                safe_margin_mm=_safe_margin_mm,
-            )
+            else:
+                print(f"[WARN] Unknown kind '{kind}' for object '{obj_cfg.get('name')}'")
+    finally:
+        if prefetch is not None:
+            prefetch.shutdown(wait=False)
 
-        else:
-            print(f"[WARN] Unknown kind '{kind}' for object '{obj_cfg.get('name')}'")
+    # Builders only write RNA properties (each tags the depsgraph); evaluate the
+    # accumulated changes once here rather than on whichever read comes next.
+    bpy.context.view_layer.update()
 
     # Optional layout overlap checking + debug boxes
     try:
@@ -2749,4 +3276,5 @@ def apply_manifest(
     except Exception as e:
         print(f"[layout] Diagnostics error: {e}")
 
+    scene[_APPLY_FINGERPRINT_PROP] = fingerprint
     return cfg
@@ -1,5 +1,7 @@
 import sys
+import os
 import argparse
+import hashlib
 from pathlib import Path
 
 import bpy
@@ -8,7 +10,7 @@ THIS_DIR = Path(__file__).resolve().parent
 if str(THIS_DIR) not in sys.path:
 	 sys.path.insert(0, str(THIS_DIR))
 
-from blendlib import apply_manifest
+from blendlib import apply_manifest, configure_cycles_devices, manifest_fingerprint
 
 
 def argv_after_dashes():
@@ -32,10 +34,58 @@ def parse_args():
 	 	 help="Override Cycles samples")
 	 p.add_argument("--no-denoise", action="store_true",
 	 	 help="Disable Cycles denoising for faster previews")
+	 p.add_argument("--device", choices=("gpu", "cpu"),
+	 	 help="Override the manifest's cycles.device (backend still comes from cycles.compute_device_type)")
+	 p.add_argument("--force", action="store_true",
+	 	 help="Render even if the output is up to date with its inputs")
 
 	 return p.parse_args(argv_after_dashes())
 
 
+def render_cache_key(args):
+	 """Hash of everything the output image depends on.
+
+	 Covers the manifest, blendlib.py and every file it references (see
+	 manifest_fingerprint), this script, and the command-line overrides.
+	 """
+	 h = hashlib.blake2b(digest_size=16)
+	 h.update(manifest_fingerprint(args.manifest).encode("utf-8"))
+	 st = os.stat(__file__)
+	 options = sorted((k, v) for k, v in vars(args).items() if k not in ("manifest", "force"))
+	 h.update(repr((st.st_mtime_ns, st.st_size, options)).encode("utf-8"))
+	 return h.hexdigest()
+
+
+def linked_library_paths():
+	 """Absolute paths of every .blend library linked into the scene, indirect ones included.
+
+	 The manifest only names the asset files; libraries those link in turn (e.g. the
+	 material library of a LINK-mode asset) are only known after apply_manifest.
+	 """
+	 paths = set()
+	 for lib in bpy.data.libraries:
+	 	 try:
+	 	 	 p = bpy.path.abspath(lib.filepath, library=lib.parent)
+	 	 except Exception:
+	 	 	 continue
+	 	 if p:
+	 	 	 paths.add(os.path.normpath(p))
+	 return sorted(paths)
+
+
+def with_libraries(cache_key, lib_paths):
+	 """Extend cache_key with the mtime/size of each linked library."""
+	 h = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16)
+	 for p in lib_paths:
+	 	 try:
+	 	 	 st = os.stat(p)
+	 	 	 stamp = f"{p}:{st.st_mtime_ns}:{st.st_size}"
+	 	 except OSError:
+	 	 	 stamp = f"{p}:missing"
+	 	 h.update(stamp.encode("utf-8"))
+	 return h.hexdigest()
+
+
 def set_engine_override(scene, engine_name):
 	 if not engine_name:
 	 	 return
@@ -101,16 +151,40 @@ def main():
 	 out_path = Path(args.output).resolve()
 	 out_path.parent.mkdir(parents=True, exist_ok=True)
 
+	 # Skip the (minutes-long) render when the image was already rendered from
+	 # identical inputs. The sidecar holds the key, then the linked libraries the
+	 # last render used, whose current stats are folded into the key.
+	 hash_path = out_path.with_name(out_path.name + ".hash")
+	 cache_key = render_cache_key(args)
+	 if not args.force and out_path.exists() and hash_path.exists():
+	 	 stored_key, *stored_libs = hash_path.read_text(encoding="utf-8").splitlines() or [""]
+	 	 if stored_key.strip() == with_libraries(cache_key, stored_libs):
+	 	 	 print(f"[render.py] Cache hit, inputs unchanged: {out_path}")
+	 	 	 return
+
 	 # Build scene from manifest (this also configures Cycles GPU devices)
-	 apply_manifest(args.manifest, ppi_override=args.ppi)
+	 cfg = apply_manifest(args.manifest, ppi_override=args.ppi)
 
 	 scene = bpy.context.scene
+	 engine_before = scene.render.engine
 
 	 # Apply optional engine/sample overrides AFTER manifest
 	 if args.engine:
 	 	 set_engine_override(scene, args.engine)
 
 	 if scene.render.engine == "CYCLES":
+	 	 # apply_manifest only picks devices when the manifest engine is Cycles
+	 	 if args.device or engine_before != "CYCLES":
+	 	 	 dev_cfg = cfg
+	 	 	 if args.device:
+	 	 	 	 # Override on a copy; never mutate the manifest apply_manifest returned
+	 	 	 	 dev_cfg = {**cfg, "cycles": {**cfg.get("cycles", {}), "device": args.device.upper()}}
+	 	 	 configure_cycles_devices(dev_cfg)
+	 	 # Keep the synced scene (BVH, textures) between render passes
+	 	 try:
+	 	 	 scene.render.use_persistent_data = True
+	 	 except Exception:
+	 	 	 pass
 	 	 if args.cycles_samples is not None:
 	 	 	 try:
 	 	 	 	 scene.cycles.samples = int(args.cycles_samples)
@@ -143,6 +217,11 @@ def main():
 
 	 bpy.ops.render.render(write_still=True)
 	 print(f"[render.py] Wrote render: {out_path}")
+	 if out_path.exists():
+	 	 lib_paths = linked_library_paths()
+	 	 hash_path.write_text(
+	 	 	 "\n".join([with_libraries(cache_key, lib_paths), *lib_paths]) + "\n", encoding="utf-8"
+	 	 )
 
 
 if __name__ == "__main__":
@@ -3,7 +3,18 @@
 Batch convert VRML2 (.wrl) files into GLB for easier, more reproducible importing.
 
 Usage:
-  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- <in.wrl|in_dir> <out_dir> [scale_factor]
+  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- <in.wrl|in_dir> <out_dir> [scale_factor] [--jobs N] [--force] [--no-optimize]
+
+--jobs N splits the input files across N background Blender processes (files are
+independent, and one Blender process converts one file at a time).
+
+Files whose .glb is already newer than the .wrl are skipped; pass --force to
+reconvert everything (e.g. after changing scale_factor).
+
+If `gltfpack` (meshoptimizer) is on PATH, each exported GLB is post-processed with it
+(vertex cache / overdraw / vertex fetch reordering), keeping node names, materials and
+full-precision attributes so Blender's glTF importer reads it as before. Pass
+--no-optimize to skip this.
 
 Notes:
 - GLB/glTF uses meters as its implied unit.
@@ -13,7 +24,12 @@ Notes:
 """
 
 import bpy
+import numpy as np
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -23,10 +39,72 @@ def argv_after_dashes():
     return []
 
 
+def pop_option(args, name):
+    """Remove `name value` from args and return value (or None)."""
+    if name not in args:
+        return None
+    i = args.index(name)
+    if i + 1 >= len(args):
+        raise SystemExit(f"{name} needs a value")
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def is_up_to_date(src: Path, out_path: Path) -> bool:
+    try:
+        return out_path.stat().st_mtime >= src.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def run_shards(positional, files, jobs):
+    """Re-run this script as `jobs` background Blender workers, one shard each.
+
+    The parent filters and sorts the file list once; each worker gets its exact
+    share (every N-th file) via a --file-list file and converts it unfiltered, so
+    workers starting at different times can't skip or duplicate files.
+    """
+    with tempfile.TemporaryDirectory(prefix="wrl2glb_") as tmp:
+        procs = []
+        for i in range(jobs):
+            list_path = Path(tmp) / f"shard_{i}.txt"
+            list_path.write_text("\n".join(str(f) for f in files[i::jobs]) + "\n", encoding="utf-8")
+            cmd = [
+                bpy.app.binary_path, "-b", "--factory-startup",
+                "-P", os.path.abspath(__file__), "--",
+                *positional, "--file-list", str(list_path),
+            ]
+            procs.append(subprocess.Popen(cmd))
+        failed = [i for i, p in enumerate(procs) if p.wait() != 0]
+    if failed:
+        raise SystemExit(f"WRL->GLB worker shard(s) failed: {failed}")
+
+
 def clean_scene():
     bpy.ops.wm.read_factory_settings(use_empty=True)
 
 
+def begin_file_collection(name: str):
+    """Create a collection for one input file and make it the import target."""
+    col = bpy.data.collections.new(name)
+    bpy.context.scene.collection.children.link(col)
+    view_layer = bpy.context.view_layer
+    view_layer.active_layer_collection = view_layer.layer_collection.children[col.name]
+    return col
+
+
+def end_file_collection(col):
+    """Delete one file's collection, its objects and everything they used.
+
+    Purging orphans after every file keeps datablock names from colliding
+    (".001" suffixes would leak into the next GLB's node/mesh names).
+    """
+    bpy.data.batch_remove(col.all_objects[:])
+    bpy.data.collections.remove(col)
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+
+
 def enable_vrml_importer():
     # Historically this was the bundled add-on module name.
     # With Blender 5 extensions, it is still commonly exposed under this module name.
@@ -46,21 +124,75 @@ def export_glb(path: Path):
     bpy.ops.export_scene.gltf(
         filepath=str(path),
         export_format='GLB',
-        use_selection=True,
+        use_selection=False,
+    )
+
+
+def scale_about_origin(objects, scale_factor: float):
+    """Uniformly scale imported content about the world origin, in data.
+
+    Scaling every mesh's vertices and every translation in the hierarchy
+    (object locations and parent-inverse offsets) by the same factor scales all
+    world positions by it, without selection or transform_apply operators (each
+    of which re-evaluates the depsgraph through the UI operator stack).
+    """
+    meshes = {o.data for o in objects if o.type == 'MESH' and o.data is not None}
+    for me in meshes:
+        co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", co)
+        co *= scale_factor
+        me.vertices.foreach_set("co", co)
+        me.update()
+    for obj in objects:
+        obj.location = obj.location * scale_factor
+        if obj.parent is not None:
+            mpi = obj.matrix_parent_inverse.copy()
+            mpi.translation = mpi.translation * scale_factor
+            obj.matrix_parent_inverse = mpi
+
+
+def optimize_glb(gltfpack: str, path: Path) -> None:
+    """Reorder the GLB's index/vertex buffers in place with gltfpack.
+
+    -noq: no quantization and no compression extensions, since Blender's importer
+    does not decode EXT_meshopt_compression; -kn/-km: keep named nodes and
+    materials so imports keep the hierarchy the poster manifest relies on.
+    """
+    tmp = path.with_suffix(".opt.glb")
+    result = subprocess.run(
+        [gltfpack, "-i", str(path), "-o", str(tmp), "-noq", "-kn", "-km"],
+        capture_output=True,
+        text=True,
     )
+    if result.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        print(f"[WARN] gltfpack failed on {path.name}; keeping unoptimized GLB:\n{result.stderr}")
+        return
+    os.replace(tmp, path)
 
 
 def main():
     args = argv_after_dashes()
+    jobs = int(pop_option(args, "--jobs") or 1)
+    file_list = pop_option(args, "--file-list")
+    worker = file_list is not None
+    force = "--force" in args
+    if force:
+        args.remove("--force")
+    no_optimize = "--no-optimize" in args
+    if no_optimize:
+        args.remove("--no-optimize")
     if len(args) < 2:
         raise SystemExit(
             "Usage:\n"
-            "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- <in.wrl|in_dir> <out_dir> [scale_factor]\n\n"
+            "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- <in.wrl|in_dir> <out_dir> [scale_factor] [--jobs N] [--force] [--no-optimize]\n\n"
             "Examples:\n"
             "  # WRL coordinates are in millimeters:\n"
             "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- assets/src/wrl assets/compiled/glb 0.001\n\n"
             "  # WRL coordinates are already meters:\n"
-            "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- assets/src/wrl assets/compiled/glb 1.0\n"
+            "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- assets/src/wrl assets/compiled/glb 1.0\n\n"
+            "  # Convert with 8 parallel Blender workers:\n"
+            "  blender -b --factory-startup -P tools/convert_wrl_to_glb.py -- assets/src/wrl assets/compiled/glb 0.001 --jobs 8\n"
         )
 
     inp = Path(args[0])
@@ -68,36 +200,68 @@ def main():
     scale_factor = float(args[2]) if len(args) >= 3 else 1.0
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    if worker:
+        # Worker: convert exactly the files the parent assigned; never re-filter.
+        files = [Path(line) for line in Path(file_list).read_text(encoding="utf-8").splitlines() if line]
+    else:
+        files = [inp] if inp.is_file() else sorted(inp.glob("*.wrl"))
+        if not files:
+            raise SystemExit(f"No .wrl files found at: {inp}")
+
+        if not force:
+            todo = []
+            for f in files:
+                if is_up_to_date(f, out_dir / (f.stem + ".glb")):
+                    print(f"[SKIP] {f.name} (up to date)")
+                else:
+                    todo.append(f)
+            files = todo
+            if not files:
+                print("[OK] All GLBs are up to date")
+                return
+
+        if jobs > 1 and len(files) > 1:
+            passthrough = ["--no-optimize"] if no_optimize else []
+            run_shards(args + passthrough, files, min(jobs, len(files)))
+            return
+
+    # One empty scene for the whole batch; each file is isolated in its own
+    # collection instead of paying for a factory reset per file. Reset before
+    # enabling the importer: a factory reset also resets add-on state.
+    clean_scene()
+
     if not enable_vrml_importer():
         raise SystemExit(
             "VRML importer not enabled.\n"
             "In Blender 5, install/enable the 'Web3D X3D/VRML2 format' extension first."
         )
 
-    files = [inp] if inp.is_file() else sorted(inp.glob("*.wrl"))
-    if not files:
-        raise SystemExit(f"No .wrl files found at: {inp}")
+    gltfpack = None if no_optimize else shutil.which("gltfpack")
+    if not no_optimize and gltfpack is None and not worker:
+        print("[INFO] gltfpack not found on PATH; GLBs are written unoptimized")
 
-    for f in files:
-        clean_scene()
-
-        # Export in meter-space to avoid unit-scale ambiguity
-        scene = bpy.context.scene
-        scene.unit_settings.system = 'METRIC'
-        scene.unit_settings.scale_length = 1.0  # treat BU as meters during export
+    # Export in meter-space to avoid unit-scale ambiguity
+    scene = bpy.context.scene
+    scene.unit_settings.system = 'METRIC'
+    scene.unit_settings.scale_length = 1.0  # treat BU as meters during export
 
-        import_wrl(f)
-
-        bpy.ops.object.select_all(action='SELECT')
+    for f in files:
+        col = begin_file_collection(f.stem)
+        try:
+            import_wrl(f)
 
-        if scale_factor != 1.0:
-            for obj in bpy.context.selected_objects:
-                obj.scale *= scale_factor
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+            # Only this file's objects are in the scene (earlier files are removed),
+            # so the export needs no selection.
+            if scale_factor != 1.0:
+                scale_about_origin(col.all_objects[:], scale_factor)
 
-        out_path = out_dir / (f.stem + ".glb")
-        export_glb(out_path)
-        print(f"[OK] {f.name} -> {out_path}")
+            out_path = out_dir / (f.stem + ".glb")
+            export_glb(out_path)
+            if gltfpack is not None:
+                optimize_glb(gltfpack, out_path)
+            print(f"[OK] {f.name} -> {out_path}")
+        finally:
+            end_file_collection(col)
 
 
 if __name__ == "__main__":
@@ -12,9 +12,9 @@ When an image on the XZ plane "faces the wrong way", the root cause is almost al
 
 This script dumps enough information to diagnose all three:
   - object transform (matrix_world, location/rotation/scale)
-  - mesh vertices (local + world)
+  - evaluated mesh vertices (local + world; modifiers applied)
   - polygon vertex order + world-space normal
-  - UVs per loop and a best-effort "vertex->uv" map
+  - a best-effort "vertex->uv" map (plus UVs per loop with --verbose)
   - image datablocks referenced by materials
 
 Usage
@@ -28,7 +28,7 @@ Run it against a .blend file:
 Optional:
   --collection EXPORT_motion      # only inspect objects under this collection
   --name_filter SCHEM_            # only objects whose name contains substring
-  --verbose                       # include more node-tree detail
+  --verbose                       # include more node-tree detail + per-loop UVs
 
 Then upload /tmp/planes_dump.json here.
 
@@ -41,11 +41,17 @@ import json
 import math
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector
 
+try:  # optional, faster serializer
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def argv_after_dashes() -> List[str]:
     if "--" in sys.argv:
@@ -58,17 +64,34 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--out", required=True, help="Output JSON path")
     p.add_argument("--collection", default=None, help="Restrict to objects under this collection name")
     p.add_argument("--name_filter", default=None, help="Substring filter on object names")
-    p.add_argument("--verbose", action="store_true", help="Include extra material node information")
+    p.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Include extra material node information and the full per-loop UV dump (uvs_per_poly)",
+    )
     return p.parse_args(argv_after_dashes())
 
 
+# mat_has_image() results keyed by Material.name_full; materials are shared by many
+# objects in generated scenes, so each node tree is scanned once per run.
+_MAT_HAS_IMAGE: Dict[str, bool] = {}
+
+
 def mat_has_image(mat: bpy.types.Material) -> bool:
-    if not mat or not getattr(mat, "use_nodes", False) or not mat.node_tree:
+    if not mat:
         return False
-    for n in mat.node_tree.nodes:
-        if n.type == "TEX_IMAGE" and getattr(n, "image", None) is not None:
-            return True
-    return False
+    key = mat.name_full
+    hit = _MAT_HAS_IMAGE.get(key)
+    if hit is not None:
+        return hit
+    result = False
+    if getattr(mat, "use_nodes", False) and mat.node_tree:
+        for n in mat.node_tree.nodes:
+            if n.type == "TEX_IMAGE" and getattr(n, "image", None) is not None:
+                result = True
+                break
+    _MAT_HAS_IMAGE[key] = result
+    return result
 
 
 def obj_uses_image(obj: bpy.types.Object) -> bool:
@@ -76,33 +99,51 @@ def obj_uses_image(obj: bpy.types.Object) -> bool:
         return False
     mats = []
     try:
-        mats = list(obj.data.materials)
+        # Slots resolve object-linked materials (image planes share one mesh).
+        mats = [slot.material for slot in obj.material_slots]
     except Exception:
         mats = []
     return any(mat_has_image(m) for m in mats if m is not None)
 
 
 def collection_objects_recursive(col: bpy.types.Collection) -> List[bpy.types.Object]:
-    out: List[bpy.types.Object] = []
-    def _walk(c: bpy.types.Collection) -> None:
-        try:
-            out.extend(list(c.objects))
-        except Exception:
-            pass
-        try:
-            for ch in c.children:
-                _walk(ch)
-        except Exception:
-            pass
-    _walk(col)
-    # Deduplicate by name (Blender object names are unique within bpy.data.objects)
-    uniq = []
-    seen = set()
-    for o in out:
-        if o and o.name not in seen:
-            uniq.append(o)
-            seen.add(o.name)
-    return uniq
+    # all_objects walks child collections and de-duplicates in C.
+    return list(col.all_objects)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_bytes(value: Any) -> bytes:
+    """Compact JSON; NumPy float64/int arrays may be passed as-is."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def write_streamed_report(
+    f, head: Dict[str, Any], list_key: str, items, tail: Dict[str, Any]
+) -> None:
+    """Write {**head, list_key: [*items], **tail} as JSON, serializing one item at a time.
+
+    Items may be a generator, so only one dumped object is held in memory at once.
+    Each list item goes on its own line to keep the file greppable.
+    """
+    f.write(b"{")
+    for k, v in head.items():
+        f.write(json_bytes(k) + b":" + json_bytes(v) + b",")
+    f.write(json_bytes(list_key) + b":[\n")
+    for i, item in enumerate(items):
+        if i:
+            f.write(b",\n")
+        f.write(json_bytes(item))
+    f.write(b"\n]")
+    for k, v in tail.items():
+        f.write(b"," + json_bytes(k) + b":" + json_bytes(v))
+    f.write(b"}\n")
 
 
 def matrix_to_list(m: Matrix) -> List[List[float]]:
@@ -113,12 +154,31 @@ def vector3(v: Vector) -> List[float]:
     return [float(v.x), float(v.y), float(v.z)]
 
 
-def get_world_normal(obj: bpy.types.Object, local_normal: Vector) -> List[float]:
-    try:
-        wn = (obj.matrix_world.to_3x3() @ local_normal).normalized()
-        return vector3(wn)
-    except Exception:
-        return [0.0, 0.0, 0.0]
+def matrix_to_np(m: Matrix) -> np.ndarray:
+    return np.array([[m[r][c] for c in range(4)] for r in range(4)], dtype=np.float64)
+
+
+def mesh_vertex_coords(me: bpy.types.Mesh) -> np.ndarray:
+    """Local vertex coordinates as an (N, 3) array, read in one foreach_get."""
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def mesh_loop_vertex_indices(me: bpy.types.Mesh) -> np.ndarray:
+    vidx = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", vidx)
+    return vidx
+
+
+def world_normals(local_normals: np.ndarray, mw: np.ndarray) -> np.ndarray:
+    """Rotate/scale (N, 3) local normals by matrix_world's 3x3 and re-normalize.
+
+    Zero-length results stay zero (as Vector.normalized() does).
+    """
+    wn = local_normals @ mw[:3, :3].T
+    length = np.linalg.norm(wn, axis=1, keepdims=True)
+    return np.divide(wn, length, out=np.zeros_like(wn), where=length > 0.0)
 
 
 def dump_material(mat: bpy.types.Material, *, verbose: bool) -> Dict[str, Any]:
@@ -164,98 +224,139 @@ def dump_material(mat: bpy.types.Material, *, verbose: bool) -> Dict[str, Any]:
     return d
 
 
-def dump_mesh_object(obj: bpy.types.Object, *, verbose: bool) -> Dict[str, Any]:
-    data: Dict[str, Any] = {
-        "name": obj.name,
-        "type": obj.type,
-        "parent": obj.parent.name if obj.parent else None,
-        "location": vector3(obj.location),
-        "rotation_euler": vector3(obj.rotation_euler),
-        "scale": vector3(obj.scale),
-        "matrix_world": matrix_to_list(obj.matrix_world),
-        "world_bbox": [vector3(obj.matrix_world @ Vector(corner)) for corner in obj.bound_box] if getattr(obj, "bound_box", None) else None,
-    }
-
-    me = obj.data
+def dump_mesh_data(me: bpy.types.Mesh, mw: np.ndarray, *, verbose: bool) -> Dict[str, Any]:
+    """Vertices, polygons and UVs of *me*; mw is the owner's matrix_world as an array."""
     # vertices local/world
-    verts_local = [vector3(v.co) for v in me.vertices]
-    verts_world = [vector3(obj.matrix_world @ v.co) for v in me.vertices]
-    data["mesh"] = {
-        "verts_local": verts_local,
-        "verts_world": verts_world,
+    co_local = mesh_vertex_coords(me).astype(np.float64)
+    co_world = co_local @ mw[:3, :3].T + mw[:3, 3]
+    mesh_dump: Dict[str, Any] = {
+        "verts_local": co_local,
+        "verts_world": co_world,
     }
 
     # find vertex closest to origin
-    origin = Vector((0.0, 0.0, 0.0))
     min_idx = None
     min_d = None
-    for i, v in enumerate(me.vertices):
-        vw = obj.matrix_world @ v.co
-        d = (vw - origin).length
-        if min_d is None or d < min_d:
-            min_d = d
-            min_idx = i
-    data["mesh"]["closest_vertex_to_world_origin"] = {
+    if len(co_world):
+        dist = np.linalg.norm(co_world, axis=1)
+        min_idx = int(dist.argmin())
+        min_d = float(dist[min_idx])
+    mesh_dump["closest_vertex_to_world_origin"] = {
         "index": int(min_idx) if min_idx is not None else None,
         "distance": float(min_d) if min_d is not None else None,
-        "coord_world": verts_world[min_idx] if min_idx is not None and min_idx < len(verts_world) else None,
-        "coord_local": verts_local[min_idx] if min_idx is not None and min_idx < len(verts_local) else None,
+        "coord_world": co_world[min_idx].tolist() if min_idx is not None else None,
+        "coord_local": co_local[min_idx].tolist() if min_idx is not None else None,
     }
 
     # polygons
+    n_polys = len(me.polygons)
+    normals_local = np.empty(n_polys * 3, dtype=np.float32)
+    me.polygons.foreach_get("normal", normals_local)
+    normals_local = normals_local.reshape(-1, 3).astype(np.float64)
+    normals_world = world_normals(normals_local, mw)
+    loop_start = np.empty(n_polys, dtype=np.int32)
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_start)
+    me.polygons.foreach_get("loop_total", loop_total)
+    loop_vidx = mesh_loop_vertex_indices(me)
+
     polys = []
-    for p in me.polygons:
+    for i, (nl, nw, ls, lt) in enumerate(
+        zip(normals_local.tolist(), normals_world.tolist(), loop_start.tolist(), loop_total.tolist())
+    ):
         polys.append({
-            "index": int(p.index),
-            "vertex_indices": [int(i) for i in p.vertices],
-            "normal_local": vector3(p.normal),
-            "normal_world": get_world_normal(obj, p.normal),
-            "normal_world_dot_plusY": float(Vector(get_world_normal(obj, p.normal)).dot(Vector((0.0, 1.0, 0.0)))),
-            "normal_world_dot_minusY": float(Vector(get_world_normal(obj, p.normal)).dot(Vector((0.0, -1.0, 0.0)))),
+            "index": i,
+            "vertex_indices": loop_vidx[ls : ls + lt],
+            "normal_local": nl,
+            "normal_world": nw,
+            # dot with +Y / -Y is just the world normal's Y component
+            "normal_world_dot_plusY": nw[1],
+            "normal_world_dot_minusY": -nw[1],
         })
-    data["mesh"]["polygons"] = polys
+    mesh_dump["polygons"] = polys
 
     # UVs (best effort)
     uv_info: Dict[str, Any] = {"active": None, "layers": []}
     if me.uv_layers:
         uv_info["active"] = me.uv_layers.active.name if me.uv_layers.active else None
+        vidx_list = loop_vidx.tolist()
         for layer in me.uv_layers:
             layer_dump = {"name": layer.name, "uvs_per_loop": []}
-            # For each poly, list loop vertex index + uv
-            for p in me.polygons:
-                loops = []
-                for li in p.loop_indices:
-                    vidx = int(me.loops[li].vertex_index)
-                    uv = layer.data[li].uv
-                    loops.append({"loop_index": int(li), "vertex_index": vidx, "uv": [float(uv.x), float(uv.y)]})
-                layer_dump["uvs_per_poly"] = layer_dump.get("uvs_per_poly", [])
-                layer_dump["uvs_per_poly"].append({"poly_index": int(p.index), "loops": loops})
+            uvs = np.empty(len(layer.data) * 2, dtype=np.float32)
+            layer.data.foreach_get("uv", uvs)
+            uvs = uvs.reshape(-1, 2).astype(np.float64)
+            uv_list = uvs.tolist()
+            # For each poly, list loop vertex index + uv (one dict per loop: verbose only)
+            if verbose and n_polys:
+                layer_dump["uvs_per_poly"] = [
+                    {
+                        "poly_index": pi,
+                        "loops": [
+                            {"loop_index": li, "vertex_index": vidx_list[li], "uv": uv_list[li]}
+                            for li in range(ls, ls + lt)
+                        ],
+                    }
+                    for pi, (ls, lt) in enumerate(zip(loop_start.tolist(), loop_total.tolist()))
+                ]
             uv_info["layers"].append(layer_dump)
 
             # build a vertex->uv map by averaging uvs for each vertex
-            vmap: Dict[int, Tuple[float, float, int]] = {}
-            for li, loop in enumerate(me.loops):
-                try:
-                    uv = layer.data[li].uv
-                except Exception:
-                    continue
-                vidx = int(loop.vertex_index)
-                if vidx not in vmap:
-                    vmap[vidx] = (float(uv.x), float(uv.y), 1)
-                else:
-                    sx, sy, n = vmap[vidx]
-                    vmap[vidx] = (sx + float(uv.x), sy + float(uv.y), n + 1)
             vmap_out = {}
-            for vidx, (sx, sy, n) in vmap.items():
-                vmap_out[str(vidx)] = [sx / n, sy / n]
+            if len(loop_vidx):
+                counts = np.bincount(loop_vidx)
+                su = np.bincount(loop_vidx, weights=uvs[:, 0])
+                sv = np.bincount(loop_vidx, weights=uvs[:, 1])
+                used = np.flatnonzero(counts)
+                avg = np.stack([su[used], sv[used]], axis=1) / counts[used, None]
+                for vidx, uv in zip(used.tolist(), avg.tolist()):
+                    vmap_out[str(vidx)] = uv
             layer_dump["vertex_uv_map"] = vmap_out
 
-    data["mesh"]["uv"] = uv_info
+    mesh_dump["uv"] = uv_info
+
+    return mesh_dump
+
+
+def dump_mesh_object(
+    obj: bpy.types.Object,
+    *,
+    verbose: bool,
+    depsgraph: Optional[bpy.types.Depsgraph] = None,
+) -> Dict[str, Any]:
+    # matrix_world is an RNA fetch (plus a Matrix allocation) on every access.
+    M = obj.matrix_world
+    mw = matrix_to_np(M)
+    bound_box = getattr(obj, "bound_box", None)
+    world_bbox = None
+    if bound_box:
+        corners = np.array([tuple(c) for c in bound_box], dtype=np.float64)
+        world_bbox = corners @ mw[:3, :3].T + mw[:3, 3]
+    data: Dict[str, Any] = {
+        "name": obj.name,
+        "type": obj.type,
+        "parent": obj.parent.name if obj.parent else None,
+        "location": vector3(obj.location),
+        "rotation_euler": vector3(obj.rotation_euler),
+        "scale": vector3(obj.scale),
+        "matrix_world": matrix_to_list(M),
+        "world_bbox": world_bbox,
+    }
+
+    # Dump the evaluated mesh (what actually renders, modifiers included). to_mesh()
+    # yields one evaluated copy for all the foreach_get reads; it is freed right after.
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    me = eval_obj.to_mesh()
+    try:
+        data["mesh"] = dump_mesh_data(me, mw, verbose=verbose)
+    finally:
+        eval_obj.to_mesh_clear()
 
     # materials
     mats = []
     try:
-        mats = list(me.materials)
+        mats = [slot.material for slot in obj.material_slots]
     except Exception:
         mats = []
     data["materials"] = [dump_material(m, verbose=verbose) for m in mats if m is not None]
@@ -265,6 +366,7 @@ def dump_mesh_object(obj: bpy.types.Object, *, verbose: bool) -> Dict[str, Any]:
 
 def main() -> None:
     args = parse_args()
+    _MAT_HAS_IMAGE.clear()
     out_path = Path(args.out).expanduser().resolve()
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -290,21 +392,17 @@ def main() -> None:
     # Focus on mesh objects that use image textures, but still list a small sample of non-image meshes for context
     image_meshes = [o for o in objs if o and o.type == "MESH" and obj_uses_image(o)]
 
-    report: Dict[str, Any] = {
+    head: Dict[str, Any] = {
         "blend_file": bpy.data.filepath,
         "num_objects_scanned": len(objs),
         "num_image_mesh_objects": len(image_meshes),
-        "image_mesh_objects": [],
-        "images_datablocks": [],
     }
 
-    for o in image_meshes:
-        report["image_mesh_objects"].append(dump_mesh_object(o, verbose=bool(args.verbose)))
-
     # Dump images datablocks
+    images_datablocks: List[Dict[str, Any]] = []
     for img in bpy.data.images:
         try:
-            report["images_datablocks"].append({
+            images_datablocks.append({
                 "name": img.name,
                 "filepath": img.filepath,
                 "size_px": [int(img.size[0]), int(img.size[1])] if getattr(img, "size", None) else None,
@@ -316,7 +414,19 @@ def main() -> None:
         except Exception:
             pass
 
-    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    # Mesh objects are dumped and written one at a time (peak memory: one object).
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    with out_path.open("wb") as f:
+        write_streamed_report(
+            f,
+            head,
+            "image_mesh_objects",
+            (
+                dump_mesh_object(o, verbose=bool(args.verbose), depsgraph=depsgraph)
+                for o in image_meshes
+            ),
+            {"images_datablocks": images_datablocks},
+        )
     print(f"[dump_image_planes] wrote: {out_path}")
     print(f"[dump_image_planes] image mesh objects: {len(image_meshes)}")
     if image_meshes:
@@ -2,8 +2,14 @@ import bpy
 import os
 import json
 import math
+from operator import attrgetter
 from datetime import datetime
 
+try:  # optional, faster serializer
+    import orjson
+except ImportError:
+    orjson = None
+
 # If these exist, the dump will focus on them (and their contents).
 # Otherwise it dumps the whole scene collection tree.
 FOCUS_COLLECTIONS = [
@@ -15,32 +21,56 @@ FOCUS_COLLECTIONS = [
     "EXPORT_joystick_torque_sensor"
 ]
 
+_RAD2DEG = 180.0 / math.pi
+
+def _json_bytes(value):
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+def _write_streamed_payload(f, head, list_key, items):
+    # {**head, list_key: [*items]}, one item serialized (and held) at a time,
+    # one item per line.
+    f.write(b"{")
+    for k, v in head.items():
+        f.write(_json_bytes(k) + b":" + _json_bytes(v) + b",")
+    f.write(_json_bytes(list_key) + b":[\n")
+    for i, item in enumerate(items):
+        if i:
+            f.write(b",\n")
+        f.write(_json_bytes(item))
+    f.write(b"\n]}\n")
+
 def _mat_to_list(m):
     return [[float(v) for v in row] for row in m]
 
 def _safe_custom_props(obj):
     # Blender stores custom properties like a dict; ignore UI metadata.
     out = {}
-    for k in obj.keys():
+    try:
+        items = obj.items()  # keys and values in one pass
+    except Exception:
+        return out
+    for k, v in items:
         if k == "_RNA_UI":
             continue
-        try:
-            v = obj[k]
-            # JSON-safe primitives only
-            if isinstance(v, (int, float, str, bool)) or v is None:
-                out[k] = v
-            else:
-                out[k] = str(v)
-        except Exception:
-            pass
+        # JSON-safe primitives only
+        if isinstance(v, (int, float, str, bool, type(None))):
+            out[k] = v
+        else:
+            out[k] = str(v)
     return out
 
 def _obj_to_dict(o):
+    # Each RNA attribute access builds a fresh wrapper; read each one once.
+    data = getattr(o, "data", None)
+    parent = o.parent
+    eul = o.rotation_euler
     d = {
         "name": o.name,
         "type": o.type,
-        "data_name": getattr(getattr(o, "data", None), "name", None),
-        "parent": o.parent.name if o.parent else None,
+        "data_name": getattr(data, "name", None),
+        "parent": parent.name if parent else None,
         "children": [c.name for c in o.children],
         "users_collection": [c.name for c in o.users_collection],
         "hide_viewport": bool(o.hide_viewport),
@@ -49,7 +79,7 @@ def _obj_to_dict(o):
         # Transforms (readable)
         "location": [float(v) for v in o.location],
         "rotation_mode": o.rotation_mode,
-        "rotation_euler_deg": [float(math.degrees(v)) for v in o.rotation_euler],
+        "rotation_euler_deg": [eul.x * _RAD2DEG, eul.y * _RAD2DEG, eul.z * _RAD2DEG],
         "rotation_quaternion": [float(v) for v in o.rotation_quaternion],
         "scale": [float(v) for v in o.scale],
 
@@ -57,7 +87,7 @@ def _obj_to_dict(o):
         "matrix_world": _mat_to_list(o.matrix_world),
 
         # Bounding box (local)
-        "bound_box_local": [list(map(float, bb)) for bb in getattr(o, "bound_box", [])],
+        "bound_box_local": [tuple(bb) for bb in getattr(o, "bound_box", [])],
 
         "constraints": [
             {
@@ -76,10 +106,10 @@ def _obj_to_dict(o):
         d["empty_display_type"] = getattr(o, "empty_display_type", None)
         d["empty_display_size"] = float(getattr(o, "empty_display_size", 0.0))
 
-    if o.type == "MESH" and getattr(o, "data", None) is not None:
+    if o.type == "MESH" and data is not None:
         try:
-            d["mesh_vertex_count"] = len(o.data.vertices)
-            d["mesh_face_count"] = len(o.data.polygons)
+            d["mesh_vertex_count"] = len(data.vertices)
+            d["mesh_face_count"] = len(data.polygons)
         except Exception:
             pass
 
@@ -102,21 +132,18 @@ def _format_collection_tree(col, indent=0):
     return lines
 
 def _gather_objects_for_focus():
-    found_focus = []
-    for name in FOCUS_COLLECTIONS:
-        if name in bpy.data.collections:
-            found_focus.append(bpy.data.collections[name])
+    collections = bpy.data.collections
+    found_focus = [c for c in map(collections.get, FOCUS_COLLECTIONS) if c is not None]
 
     if found_focus:
         objs = set()
         for c in found_focus:
-            for o in c.all_objects:
-                objs.add(o)
-        return found_focus, sorted(list(objs), key=lambda x: x.name)
+            objs.update(c.all_objects)
+        return found_focus, sorted(objs, key=attrgetter("name"))
 
     # fallback: dump active scene
     scene = bpy.context.scene
-    return [], sorted(list(scene.objects), key=lambda x: x.name)
+    return [], sorted(scene.objects, key=attrgetter("name"))
 
 def main():
     blend_path = bpy.data.filepath
@@ -140,17 +167,16 @@ def main():
         collection_roots = {"SCENE_COLLECTION_ROOT": _collection_to_dict(root)}
         md_text = "\n".join(["# Scene collection tree"] + _format_collection_tree(root) + [""])
 
-    payload = {
+    head = {
         "generated_at": datetime.now().isoformat(),
         "blend_filepath": blend_path,
         "scene_name": bpy.context.scene.name if bpy.context.scene else None,
         "focus_collections": [c.name for c in focus_cols],
         "collections": collection_roots,
-        "objects": [_obj_to_dict(o) for o in objs],
     }
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    with open(json_path, "wb") as f:
+        _write_streamed_payload(f, head, "objects", (_obj_to_dict(o) for o in objs))
 
     with open(md_path, "w", encoding="utf-8") as f:
         f.write(md_text)
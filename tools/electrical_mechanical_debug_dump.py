@@ -12,6 +12,9 @@
 #    blender yourfile.blend --python assets/build/electrical_mechanical/debug_dump.py -- \
 #      --out /tmp/debug.json
 #
+# Add --level presence (or minimal) to skip per-object transforms and bounds
+# when only checking what was imported.
+#
 # The script writes a JSON report and prints a short summary to stdout.
 #
 # Notes:
@@ -20,6 +23,7 @@
 #   and whether instances landed at the expected transforms.
 
 import argparse
+import functools
 import json
 import math
 import os
@@ -28,7 +32,12 @@ import traceback
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import bpy
-from mathutils import Vector
+import numpy as np
+
+try:  # optional, faster serializer
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ----------------------------
@@ -44,6 +53,12 @@ def _abspath(p: str, base_dir: Optional[str] = None) -> str:
     return os.path.normpath(os.path.abspath(os.path.join(base, p)))
 
 
+@functools.lru_cache(maxsize=None)
+def _file_exists(path: str) -> bool:
+    """os.path.exists, probed once per distinct path."""
+    return os.path.exists(path)
+
+
 def _safe_float(x: Any) -> Optional[float]:
     try:
         return float(x)
@@ -53,14 +68,17 @@ def _safe_float(x: Any) -> Optional[float]:
 
 def _vec_to_list(v: Any) -> List[float]:
     try:
-        return [float(v[0]), float(v[1]), float(v[2])]
+        out = list(v[:3])  # one slice; mathutils returns plain floats
+        if len(out) != 3:
+            return []
+        return out
     except Exception:
         return []
 
 
 def _matrix_to_list(m) -> List[List[float]]:
     try:
-        return [[float(m[r][c]) for c in range(4)] for r in range(4)]
+        return [list(row) for row in m]
     except Exception:
         return []
 
@@ -80,7 +98,8 @@ def _quat_list(q) -> List[float]:
 
 
 def _to_mm(v: List[float], mm_per_bu: float) -> List[float]:
-    return [float(v[0]) * mm_per_bu, float(v[1]) * mm_per_bu, float(v[2]) * mm_per_bu]
+    # v comes from _vec_to_list/_bbox_world and already holds floats
+    return [x * mm_per_bu for x in v]
 
 
 def _bbox_world(obj) -> Optional[Dict[str, Any]]:
@@ -89,17 +108,15 @@ def _bbox_world(obj) -> Optional[Dict[str, Any]]:
         bb = obj.bound_box  # 8 corners in local space
         if not bb:
             return None
-        corners_world = [obj.matrix_world @ Vector(c) for c in bb]
-        xs = [c.x for c in corners_world]
-        ys = [c.y for c in corners_world]
-        zs = [c.z for c in corners_world]
-        vmin = Vector((min(xs), min(ys), min(zs)))
-        vmax = Vector((max(xs), max(ys), max(zs)))
-        dims = vmax - vmin
+        mw = np.array(obj.matrix_world, dtype=np.float64)
+        corners = np.array(bb, dtype=np.float64)  # (8, 3)
+        corners_world = corners @ mw[:3, :3].T + mw[:3, 3]
+        vmin = corners_world.min(axis=0)
+        vmax = corners_world.max(axis=0)
         return {
-            "min": [float(vmin.x), float(vmin.y), float(vmin.z)],
-            "max": [float(vmax.x), float(vmax.y), float(vmax.z)],
-            "dims": [float(dims.x), float(dims.y), float(dims.z)],
+            "min": vmin.tolist(),
+            "max": vmax.tolist(),
+            "dims": (vmax - vmin).tolist(),
         }
     except Exception:
         return None
@@ -123,219 +140,283 @@ def _collection_objects(coll) -> List["bpy.types.Object"]:
         return []
 
 
-def _collection_tree(root_coll, max_objects_per_collection: int = 50, visited: Optional[Set[str]] = None) -> Dict[str, Any]:
-    if visited is None:
-        visited = set()
-    name = getattr(root_coll, "name", "<unknown>")
-    node_id = name
-    if node_id in visited:
-        return {"name": name, "cycle": True}
-    visited.add(node_id)
-
-    objects = _collection_objects(root_coll)
-    obj_names = [o.name for o in objects]
-    if max_objects_per_collection is not None and len(obj_names) > max_objects_per_collection:
-        obj_names = obj_names[:max_objects_per_collection] + [f"... ({len(objects) - max_objects_per_collection} more)"]
-
-    lib_path = None
+def _collection_key(coll) -> Any:
+    """Identity of a collection: a local and a linked collection may share a name."""
     try:
-        if root_coll.library:
-            lib_path = root_coll.library.filepath
+        return coll.as_pointer()
     except Exception:
-        lib_path = None
-
-    out = {
-        "name": name,
-        "hide_viewport": bool(getattr(root_coll, "hide_viewport", False)),
-        "hide_render": bool(getattr(root_coll, "hide_render", False)),
-        "library_filepath": lib_path,
-        "objects": obj_names,
-        "children": [],
-    }
-    for ch in _collection_children(root_coll):
-        out["children"].append(_collection_tree(ch, max_objects_per_collection=max_objects_per_collection, visited=visited))
-    return out
+        return getattr(coll, "name", None)
+
+
+def _collection_tree(
+    root_coll,
+    max_objects_per_collection: int = 50,
+    visited: Optional[Set[Any]] = None,
+) -> Dict[str, Any]:
+    # Iterative pre-order walk (children in order); deep hierarchies don't hit
+    # the recursion limit. A collection seen before (diamond or cycle) is
+    # emitted as a stub, so each subtree is serialized once. *visited* collects
+    # the _collection_key() of every collection walked.
+    if visited is None:
+        visited = set()
+    root_out: Dict[str, Any] = {}
+    stack = [(root_coll, None)]
+    while stack:
+        coll, parent_children = stack.pop()
+        name = getattr(coll, "name", "<unknown>")
+        key = _collection_key(coll)
+        if key in visited:
+            out = {"name": name, "cycle": True}
+        else:
+            visited.add(key)
+
+            objects = _collection_objects(coll)
+            obj_names = [o.name for o in objects]
+            if max_objects_per_collection is not None and len(obj_names) > max_objects_per_collection:
+                obj_names = obj_names[:max_objects_per_collection] + [f"... ({len(objects) - max_objects_per_collection} more)"]
+
+            lib_path = None
+            try:
+                if coll.library:
+                    lib_path = coll.library.filepath
+            except Exception:
+                lib_path = None
+
+            out = {
+                "name": name,
+                "hide_viewport": bool(getattr(coll, "hide_viewport", False)),
+                "hide_render": bool(getattr(coll, "hide_render", False)),
+                "library_filepath": lib_path,
+                "objects": obj_names,
+                "children": [],
+            }
+            for ch in reversed(_collection_children(coll)):
+                stack.append((ch, out["children"]))
+
+        if parent_children is None:
+            root_out = out
+        else:
+            parent_children.append(out)
+    return root_out
 
 
-def _collections_reachable_from_scene(scene) -> Set[str]:
-    reachable: Set[str] = set()
+def _collections_reachable_from_scene(scene) -> Set[Any]:
+    """_collection_key() of every collection in the scene's hierarchy."""
+    reachable: Set[Any] = set()
     stack = [scene.collection]
     while stack:
         c = stack.pop()
         if c is None:
             continue
-        if c.name in reachable:
+        key = _collection_key(c)
+        if key in reachable:
             continue
-        reachable.add(c.name)
+        reachable.add(key)
         try:
-            stack.extend(list(c.children))
+            stack.extend(c.children)
         except Exception:
             pass
     return reachable
 
 
-def _is_collection_in_scene(scene, coll_name: str) -> bool:
-    if not scene or not coll_name:
+def _is_collection_in_scene(scene, coll, reachable: Optional[Set[Any]] = None) -> bool:
+    """*coll* is a collection or a name (resolved via bpy.data.collections).
+
+    Pass *reachable* (from _collections_reachable_from_scene) to skip the walk.
+    """
+    if not scene or not coll:
         return False
-    reachable = _collections_reachable_from_scene(scene)
-    return coll_name in reachable
+    if isinstance(coll, str):
+        coll = bpy.data.collections.get(coll)
+        if coll is None:
+            return False
+    if reachable is None:
+        reachable = _collections_reachable_from_scene(scene)
+    return _collection_key(coll) in reachable
 
 
 def _objects_in_collection_recursive(coll) -> List["bpy.types.Object"]:
-    objs: Set["bpy.types.Object"] = set()
+    # all_objects walks child collections and de-duplicates in C.
+    try:
+        return list(coll.all_objects)
+    except Exception:
+        return []
 
-    def _rec(c):
-        try:
-            for o in c.objects:
-                objs.add(o)
-        except Exception:
-            pass
+
+def _world_corners(objs: List["bpy.types.Object"]) -> Tuple[List[int], Optional[np.ndarray]]:
+    """World-space bound_box corners as an (M, 8, 3) array, plus the index in
+    *objs* of each of the M objects that expose a bound_box.
+
+    Corners and matrices are gathered first and transformed in one einsum
+    rather than per object.
+    """
+    idx = []
+    corners = []
+    mats = []
+    for i, o in enumerate(objs):
         try:
-            for ch in c.children:
-                _rec(ch)
+            bb = o.bound_box
+            if not bb:
+                continue
+            c = np.array(bb, dtype=np.float64)
+            m = np.array(o.matrix_world, dtype=np.float64)
         except Exception:
-            pass
-
-    _rec(coll)
-    return list(objs)
+            continue
+        idx.append(i)
+        corners.append(c)
+        mats.append(m)
+    if not corners:
+        return idx, None
+    corners = np.stack(corners)  # (M, 8, 3)
+    mats = np.stack(mats)  # (M, 4, 4)
+    world = np.einsum("nij,nkj->nki", mats[:, :3, :3], corners) + mats[:, None, :3, 3]
+    return idx, world
+
+
+def _bboxes_world(objs: List["bpy.types.Object"]) -> List[Optional[Dict[str, Any]]]:
+    """_bbox_world() for every object in *objs*, computed as one batch."""
+    out: List[Optional[Dict[str, Any]]] = [None] * len(objs)
+    idx, world = _world_corners(objs)
+    if world is None:
+        return out
+    vmin = world.min(axis=1)
+    vmax = world.max(axis=1)
+    for i, mn, mx, dims in zip(idx, vmin.tolist(), vmax.tolist(), (vmax - vmin).tolist()):
+        out[i] = {"min": mn, "max": mx, "dims": dims}
+    return out
 
 
 def _union_bbox_for_objects(objs: List["bpy.types.Object"]) -> Optional[Dict[str, Any]]:
-    mins = []
-    maxs = []
-    for o in objs:
-        bb = _bbox_world(o)
-        if not bb:
-            continue
-        mins.append(Vector(bb["min"]))
-        maxs.append(Vector(bb["max"]))
-    if not mins:
+    _, world = _world_corners(objs)
+    if world is None:
         return None
-    vmin = Vector((min(v.x for v in mins), min(v.y for v in mins), min(v.z for v in mins)))
-    vmax = Vector((max(v.x for v in maxs), max(v.y for v in maxs), max(v.z for v in maxs)))
-    dims = vmax - vmin
-    return {"min": [float(vmin.x), float(vmin.y), float(vmin.z)],
-            "max": [float(vmax.x), float(vmax.y), float(vmax.z)],
-            "dims": [float(dims.x), float(dims.y), float(dims.z)]}
+    world = world.reshape(-1, 3)
+    vmin = world.min(axis=0)
+    vmax = world.max(axis=0)
+    return {"min": vmin.tolist(),
+            "max": vmax.tolist(),
+            "dims": (vmax - vmin).tolist()}
 
 
 # ----------------------------
 # Object serialization
 # ----------------------------
 
-def _object_to_dict(obj, scene, mm_per_bu: float) -> Dict[str, Any]:
-    d: Dict[str, Any] = {}
-    d["name"] = obj.name
-    d["type"] = obj.type
-    d["data_name"] = getattr(obj.data, "name", None)
+# Object types with real geometry bounds; for empties, lights and cameras
+# bound_box/dimensions are placeholders, so they are not computed.
+_GEOM_TYPES = frozenset({
+    "MESH", "CURVE", "CURVES", "META", "SURFACE", "FONT",
+    "POINTCLOUD", "VOLUME", "GPENCIL", "GREASEPENCIL",
+})
 
-    # visibility
-    d["hide_viewport"] = bool(getattr(obj, "hide_viewport", False))
-    d["hide_render"] = bool(getattr(obj, "hide_render", False))
-    try:
-        d["hide_get"] = bool(obj.hide_get())
-    except Exception:
-        d["hide_get"] = None
-    try:
-        d["visible_get"] = bool(obj.visible_get())
-    except Exception:
-        d["visible_get"] = None
 
-    # library linkage
-    lib = None
-    try:
-        if obj.library:
-            lib = obj.library.filepath
-    except Exception:
-        lib = None
-    d["library_filepath"] = lib
+# --level choices, least to most detail
+DUMP_LEVELS = ("minimal", "presence", "full")
 
-    # transforms
-    try:
-        d["location_bu"] = _vec_to_list(obj.location)
-        d["location_mm"] = _to_mm(d["location_bu"], mm_per_bu)
-    except Exception:
-        d["location_bu"] = []
-        d["location_mm"] = []
 
-    try:
-        d["rotation_mode"] = obj.rotation_mode
-        d["rotation_euler_deg"] = _euler_deg(obj.rotation_euler)
-        d["rotation_quaternion"] = _quat_list(obj.rotation_quaternion)
-    except Exception:
-        d["rotation_mode"] = None
-        d["rotation_euler_deg"] = []
-        d["rotation_quaternion"] = []
+def _object_to_dict(
+    obj,
+    scene,
+    mm_per_bu: float,
+    bbox_world: Optional[Dict[str, Any]] = None,
+    level: str = "full",
+) -> Dict[str, Any]:
+    """*bbox_world* is this object's entry from _bboxes_world(), if precomputed.
 
-    try:
-        d["scale"] = _vec_to_list(obj.scale)
-    except Exception:
-        d["scale"] = []
+    *level* "minimal" gives name and type; "presence" adds visibility,
+    linkage, parenting and collection membership; "full" adds transforms,
+    bounds, mesh stats and materials.
 
+    Plain RNA reads don't fail on a valid object, so a single guard covers
+    them; if one does, the fields gathered so far are kept and "error" is set.
+    """
+    d: Dict[str, Any] = {"name": obj.name}
     try:
-        d["matrix_world"] = _matrix_to_list(obj.matrix_world)
-    except Exception:
-        d["matrix_world"] = []
+        obj_type = obj.type
+        d["type"] = obj_type
+        if level == "minimal":
+            return d
+        data = obj.data
+        d["data_name"] = getattr(data, "name", None)
+
+        # visibility (hide_get/visible_get raise for objects outside the view layer)
+        d["hide_viewport"] = bool(obj.hide_viewport)
+        d["hide_render"] = bool(obj.hide_render)
+        try:
+            d["hide_get"] = bool(obj.hide_get())
+            d["visible_get"] = bool(obj.visible_get())
+        except RuntimeError:
+            d.setdefault("hide_get", None)
+            d["visible_get"] = None
 
-    # parenting
-    d["parent"] = obj.parent.name if obj.parent else None
+        # library linkage
+        lib = obj.library
+        d["library_filepath"] = lib.filepath if lib else None
 
-    # collections membership
-    try:
+        # parenting
+        parent = obj.parent
+        d["parent"] = parent.name if parent else None
+
+        # collections membership
         d["users_collection"] = [c.name for c in obj.users_collection]
-    except Exception:
-        d["users_collection"] = []
 
-    # instance collections (empties)
-    try:
+        # instance collections (empties)
         d["instance_type"] = obj.instance_type
-    except Exception:
-        d["instance_type"] = None
-
-    try:
         ic = obj.instance_collection
         d["instance_collection"] = ic.name if ic else None
-    except Exception:
-        d["instance_collection"] = None
-
-    # bounding box + dimensions
-    bb = _bbox_world(obj)
-    if bb:
-        d["bound_box_world_bu"] = bb
-        d["bound_box_world_mm"] = {
-            "min": _to_mm(bb["min"], mm_per_bu),
-            "max": _to_mm(bb["max"], mm_per_bu),
-            "dims": _to_mm(bb["dims"], mm_per_bu),
-        }
-    else:
-        d["bound_box_world_bu"] = None
-        d["bound_box_world_mm"] = None
 
-    try:
-        dims = obj.dimensions
-        d["dimensions_bu"] = _vec_to_list(dims)
-        d["dimensions_mm"] = _to_mm(d["dimensions_bu"], mm_per_bu)
-    except Exception:
-        d["dimensions_bu"] = []
-        d["dimensions_mm"] = []
+        if level != "full":
+            return d
 
-    # mesh stats (optional but useful)
-    if obj.type == "MESH" and getattr(obj, "data", None) is not None:
-        try:
-            d["mesh_vertex_count"] = len(obj.data.vertices)
-            d["mesh_face_count"] = len(obj.data.polygons)
-        except Exception:
-            d["mesh_vertex_count"] = None
-            d["mesh_face_count"] = None
+        # transforms
+        d["location_bu"] = _vec_to_list(obj.location)
+        d["location_mm"] = _to_mm(d["location_bu"], mm_per_bu)
 
-    # materials (names only)
-    try:
-        mats = []
-        if obj.type == "MESH" and obj.data and hasattr(obj.data, "materials"):
-            mats = [m.name for m in obj.data.materials if m]
-        d["materials"] = mats
-    except Exception:
-        d["materials"] = []
+        # only the rotation that rotation_mode actually uses; the other is None
+        mode = obj.rotation_mode
+        d["rotation_mode"] = mode
+        if mode == "QUATERNION":
+            d["rotation_euler_deg"] = None
+            d["rotation_quaternion"] = _quat_list(obj.rotation_quaternion)
+        else:
+            d["rotation_euler_deg"] = _euler_deg(obj.rotation_euler)
+            d["rotation_quaternion"] = None
+
+        d["scale"] = _vec_to_list(obj.scale)
+        d["matrix_world"] = _matrix_to_list(obj.matrix_world)
+
+        # bounding box + dimensions
+        has_geom = obj_type in _GEOM_TYPES
+        bb = None
+        if has_geom:
+            bb = bbox_world if bbox_world is not None else _bbox_world(obj)
+        if bb:
+            d["bound_box_world_bu"] = bb
+            d["bound_box_world_mm"] = {
+                "min": _to_mm(bb["min"], mm_per_bu),
+                "max": _to_mm(bb["max"], mm_per_bu),
+                "dims": _to_mm(bb["dims"], mm_per_bu),
+            }
+        else:
+            d["bound_box_world_bu"] = None
+            d["bound_box_world_mm"] = None
+
+        if has_geom:
+            d["dimensions_bu"] = _vec_to_list(obj.dimensions)
+            d["dimensions_mm"] = _to_mm(d["dimensions_bu"], mm_per_bu)
+        else:
+            d["dimensions_bu"] = None
+            d["dimensions_mm"] = None
+
+        # mesh stats + materials (names only)
+        if obj_type == "MESH" and data is not None:
+            d["mesh_vertex_count"] = len(data.vertices)
+            d["mesh_face_count"] = len(data.polygons)
+            d["materials"] = [slot.material.name for slot in obj.material_slots if slot.material]
+        else:
+            d["materials"] = []
+    except Exception as e:
+        d["error"] = repr(e)
 
     return d
 
@@ -348,8 +429,9 @@ def _load_manifest(manifest_path: str) -> Optional[Dict[str, Any]]:
     if not manifest_path:
         return None
     try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(manifest_path, "rb") as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     except Exception:
         return None
 
@@ -405,34 +487,63 @@ def _collect_expected_from_manifest(m: Dict[str, Any]) -> Dict[str, Any]:
     return expected
 
 
-def _find_collections_by_base_name(name: str) -> List["bpy.types.Collection"]:
-    """Return collections whose name matches name exactly, or name with Blender numeric suffix (.001)."""
+def _collections_by_base_name() -> Dict[str, List["bpy.types.Collection"]]:
+    """Index bpy.data.collections under every dot-prefix of their names ("a.b.001" -> "a", "a.b")."""
+    index: Dict[str, List["bpy.types.Collection"]] = {}
+    for c in bpy.data.collections:
+        name = c.name
+        pos = name.find(".")
+        while pos != -1:
+            index.setdefault(name[:pos], []).append(c)
+            pos = name.find(".", pos + 1)
+    return index
+
+
+def _find_collections_by_base_name(
+    name: str, index: Optional[Dict[str, List["bpy.types.Collection"]]] = None
+) -> List["bpy.types.Collection"]:
+    """Return collections whose name matches name exactly, or name with Blender numeric suffix (.001).
+
+    Pass *index* (from _collections_by_base_name) to avoid scanning bpy.data.collections.
+    """
     if not name:
         return []
+    if index is None:
+        index = _collections_by_base_name()
     exact = bpy.data.collections.get(name)
     out = []
     if exact:
         out.append(exact)
     # also find suffixed variants
-    prefix = name + "."
-    for c in bpy.data.collections:
-        if c.name.startswith(prefix):
-            out.append(c)
+    out.extend(index.get(name, ()))
     return out
 
 
-def _find_instance_objects_for_collection(scene, coll) -> List["bpy.types.Object"]:
-    found = []
+def _instance_objects_by_collection(scene) -> Dict["bpy.types.Collection", List["bpy.types.Object"]]:
+    index: Dict["bpy.types.Collection", List["bpy.types.Object"]] = {}
     for o in scene.objects:
         try:
-            if o.instance_type == "COLLECTION" and o.instance_collection == coll:
-                found.append(o)
+            if o.instance_type == "COLLECTION" and o.instance_collection is not None:
+                index.setdefault(o.instance_collection, []).append(o)
         except Exception:
             continue
-    return found
+    return index
+
 
+def _find_instance_objects_for_collection(
+    scene, coll, index: Optional[Dict["bpy.types.Collection", List["bpy.types.Object"]]] = None
+) -> List["bpy.types.Object"]:
+    """Pass *index* (from _instance_objects_by_collection) to avoid scanning scene.objects."""
+    if index is None:
+        index = _instance_objects_by_collection(scene)
+    return list(index.get(coll, ()))
 
+
+@functools.lru_cache(maxsize=None)
 def _normalize_blender_filepath(fp: Optional[str]) -> Optional[str]:
+    # Cached: the same image/library paths are normalized for the report and
+    # for the manifest checks, and bpy.path.abspath only depends on the
+    # (unchanging) opened .blend path.
     if not fp:
         return None
     try:
@@ -442,19 +553,53 @@ def _normalize_blender_filepath(fp: Optional[str]) -> Optional[str]:
     return os.path.normpath(fp)
 
 
-def _manifest_presence_checks(scene, expected: Dict[str, Any], base_dir: str, mm_per_bu: float) -> Dict[str, Any]:
+def _normalized_filepaths(datablocks) -> Dict[Any, Optional[str]]:
+    """Datablock -> normalized filepath, for images/libraries, resolved once per run."""
+    return {db: _normalize_blender_filepath(getattr(db, "filepath", None)) for db in datablocks}
+
+
+def _manifest_presence_checks(
+    scene,
+    expected: Dict[str, Any],
+    base_dir: str,
+    mm_per_bu: float,
+    reachable: Optional[Set[Any]] = None,
+    image_paths: Optional[Dict[Any, Optional[str]]] = None,
+    library_paths: Optional[Dict[Any, Optional[str]]] = None,
+) -> Dict[str, Any]:
     checks: Dict[str, Any] = {"export_collection": {}, "schematics": {}, "components": {}}
+    if reachable is None:
+        reachable = _collections_reachable_from_scene(scene)
+    # Built once; the per-component lookups below would otherwise rescan
+    # bpy.data.collections and scene.objects for every side/kind.
+    colls_by_base = _collections_by_base_name()
+    instances_by_coll = _instance_objects_by_collection(scene)
 
     # export collection
     exp = expected.get("export_collection")
     checks["export_collection"]["name"] = exp
     if exp:
         checks["export_collection"]["exists_in_bpy_data"] = bool(bpy.data.collections.get(exp))
-        checks["export_collection"]["reachable_from_scene"] = _is_collection_in_scene(scene, exp)
+        checks["export_collection"]["reachable_from_scene"] = _is_collection_in_scene(scene, exp, reachable)
     else:
         checks["export_collection"]["exists_in_bpy_data"] = False
         checks["export_collection"]["reachable_from_scene"] = False
 
+    # normalized filepath -> image names / library paths, so each side and
+    # component is a dict lookup rather than a bpy.path.abspath() per datablock
+    if image_paths is None:
+        image_paths = _normalized_filepaths(bpy.data.images)
+    if library_paths is None:
+        library_paths = _normalized_filepaths(bpy.data.libraries)
+    images_by_path: Dict[str, List[str]] = {}
+    for im, fp in image_paths.items():
+        if fp:
+            images_by_path.setdefault(fp, []).append(im.name)
+    libraries_by_path: Dict[str, List[str]] = {}
+    for fp in library_paths.values():
+        if fp:
+            libraries_by_path.setdefault(fp, []).append(fp)
+
     # schematics
     for side, s in expected.get("schematics", {}).items():
         img_path = s.get("image_path")
@@ -462,17 +607,12 @@ def _manifest_presence_checks(scene, expected: Dict[str, Any], base_dir: str, mm
         status = {"enabled": enabled, "image_path": img_path}
         abs_img = _abspath(img_path, base_dir) if img_path else None
         status["image_abspath"] = abs_img
-        status["image_file_exists_on_disk"] = bool(abs_img and os.path.exists(abs_img))
+        status["image_file_exists_on_disk"] = bool(abs_img and _file_exists(abs_img))
 
         # is the image loaded in bpy.data.images?
         if abs_img:
             norm = os.path.normpath(abs_img)
-            matches = []
-            for im in bpy.data.images:
-                fp = _normalize_blender_filepath(getattr(im, "filepath", None))
-                if fp and os.path.normpath(fp) == norm:
-                    matches.append(im.name)
-            status["image_datablocks"] = matches
+            status["image_datablocks"] = list(images_by_path.get(norm, ()))
 
         checks["schematics"][side] = status
 
@@ -489,30 +629,22 @@ def _manifest_presence_checks(scene, expected: Dict[str, Any], base_dir: str, mm
                 "blend_collection": blend_coll,
                 "blend_abspath": _abspath(blend, base_dir) if blend else None,
             }
-            status["blend_file_exists_on_disk"] = bool(status["blend_abspath"] and os.path.exists(status["blend_abspath"]))
+            status["blend_file_exists_on_disk"] = bool(status["blend_abspath"] and _file_exists(status["blend_abspath"]))
 
             # libraries loaded?
-            libs = []
             if status["blend_abspath"]:
                 norm_blend = os.path.normpath(status["blend_abspath"])
-                for lib in bpy.data.libraries:
-                    try:
-                        fp = _normalize_blender_filepath(lib.filepath)
-                    except Exception:
-                        fp = lib.filepath
-                    if fp and os.path.normpath(fp) == norm_blend:
-                        libs.append(fp)
-                status["loaded_libraries_matching_blend"] = libs
+                status["loaded_libraries_matching_blend"] = list(libraries_by_path.get(norm_blend, ()))
 
             # collection present?
-            coll_matches = _find_collections_by_base_name(blend_coll) if blend_coll else []
+            coll_matches = _find_collections_by_base_name(blend_coll, colls_by_base) if blend_coll else []
             status["collection_matches_in_bpy_data"] = []
             for c in coll_matches:
                 try:
                     status["collection_matches_in_bpy_data"].append({
                         "name": c.name,
                         "library_filepath": c.library.filepath if c.library else None,
-                        "reachable_from_scene": _is_collection_in_scene(scene, c.name),
+                        "reachable_from_scene": _is_collection_in_scene(scene, c, reachable),
                         "recursive_object_count": len(_objects_in_collection_recursive(c)),
                         "union_bbox_world_mm": None,
                     })
@@ -522,7 +654,7 @@ def _manifest_presence_checks(scene, expected: Dict[str, Any], base_dir: str, mm
             # instance objects (empties) in the scene for each match
             inst = []
             for c in coll_matches:
-                for o in _find_instance_objects_for_collection(scene, c):
+                for o in _find_instance_objects_for_collection(scene, c, instances_by_coll):
                     inst.append({
                         "object": o.name,
                         "location_mm": _to_mm(_vec_to_list(o.location), mm_per_bu),
@@ -536,6 +668,39 @@ def _manifest_presence_checks(scene, expected: Dict[str, Any], base_dir: str, mm
     return checks
 
 
+# ----------------------------
+# Report output
+# ----------------------------
+
+def _json_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _write_report(f, report: Dict[str, Any], focus_objects=None) -> None:
+    """Write *report* to the binary file *f*, one top-level key per line.
+
+    If *focus_objects* is given (an iterable, typically a generator), it is
+    written as report["focus"]["objects"] one item per line, so the serialized
+    objects never all exist in memory at once.
+    """
+    f.write(b"{")
+    for i, (k, v) in enumerate(report.items()):
+        f.write((b",\n" if i else b"\n") + _json_bytes(k) + b":")
+        if k == "focus" and focus_objects is not None:
+            f.write(b"{")
+            for fk, fv in v.items():
+                f.write(_json_bytes(fk) + b":" + _json_bytes(fv) + b",")
+            f.write(b'"objects":[')
+            for j, item in enumerate(focus_objects):
+                f.write((b",\n" if j else b"\n") + _json_bytes(item))
+            f.write(b"\n]}")
+        else:
+            f.write(_json_bytes(v))
+    f.write(b"\n}\n")
+
+
 # ----------------------------
 # Main
 # ----------------------------
@@ -556,6 +721,9 @@ def _parse_args() -> argparse.Namespace:
                    help="Limit object name lists inside collection tree nodes (keeps tree readable).")
     p.add_argument("--max-scene-objects", type=int, default=20000,
                    help="Hard cap on scene object serialization (safety).")
+    p.add_argument("--level", choices=DUMP_LEVELS, default="full",
+                   help="Per-object detail: minimal (name/type), presence (+visibility, linkage, "
+                        "collections), full (+transforms, bounds, mesh stats). Default: full.")
     return p.parse_args(argv)
 
 
@@ -599,6 +767,7 @@ def main() -> int:
             "cwd": base_dir,
             "manifest_path": _abspath(manifest_path, base_dir) if manifest_path else None,
             "export_collection_target": export_collection_name,
+            "level": args.level,
         },
         "scene": {
             "name": scene.name,
@@ -619,11 +788,15 @@ def main() -> int:
         "warnings": [],
     }
 
+    # normalized once, shared by the report sections and the manifest checks
+    library_paths = _normalized_filepaths(bpy.data.libraries)
+    image_paths = _normalized_filepaths(bpy.data.images)
+
     # libraries
     for lib in bpy.data.libraries:
         try:
             report["libraries"].append({
-                "filepath": _normalize_blender_filepath(lib.filepath),
+                "filepath": library_paths.get(lib),
                 "name": getattr(lib, "name", None),
             })
         except Exception:
@@ -634,7 +807,7 @@ def main() -> int:
         try:
             report["images"].append({
                 "name": im.name,
-                "filepath": _normalize_blender_filepath(getattr(im, "filepath", None)),
+                "filepath": image_paths.get(im),
                 "packed": bool(getattr(im, "packed_file", None) is not None),
                 "size_px": [int(getattr(im, "size", [0, 0])[0]), int(getattr(im, "size", [0, 0])[1])],
                 "users": int(getattr(im, "users", 0)),
@@ -642,16 +815,21 @@ def main() -> int:
         except Exception:
             report["images"].append({"name": im.name})
 
-    # collection tree
+    # collection tree; the collections it visits are exactly those reachable
+    # from the scene, so a complete walk doubles as the reachable set. The scene
+    # is not modified below, so that set is reused for every reachability check.
+    reachable: Set[Any] = set()
     try:
-        report["collection_tree"] = _collection_tree(scene.collection, max_objects_per_collection=args.max_objects_per_collection)
+        report["collection_tree"] = _collection_tree(
+            scene.collection, max_objects_per_collection=args.max_objects_per_collection, visited=reachable
+        )
     except Exception:
         report["collection_tree"] = {"error": "failed_to_build_collection_tree"}
+        reachable = _collections_reachable_from_scene(scene)
 
     # orphan collections
-    reachable = _collections_reachable_from_scene(scene)
     for c in bpy.data.collections:
-        if c.name not in reachable:
+        if _collection_key(c) not in reachable:
             report["orphans"]["collections_not_in_scene_tree"].append({
                 "name": c.name,
                 "library_filepath": c.library.filepath if c.library else None,
@@ -660,22 +838,29 @@ def main() -> int:
             })
 
     # orphan objects
-    scene_obj_names = set(o.name for o in scene.objects)
-    for o in bpy.data.objects:
-        if o.name not in scene_obj_names:
-            report["orphans"]["objects_not_in_scene"].append({
-                "name": o.name,
-                "type": o.type,
-                "library_filepath": o.library.filepath if o.library else None,
-                "users_collection": [c.name for c in getattr(o, "users_collection", [])],
-            })
-
-    # focus: export collection + its objects (if present and reachable)
+    scene_obj_names = frozenset(o.name for o in scene.objects)
+    report["orphans"]["objects_not_in_scene"] = [
+        {
+            "name": o.name,
+            "type": o.type,
+            "library_filepath": o.library.filepath if o.library else None,
+            "users_collection": [c.name for c in getattr(o, "users_collection", [])],
+        }
+        for o in bpy.data.objects
+        if o.name not in scene_obj_names
+    ]
+
+    # focus: export collection + its objects (if present and reachable).
+    # The per-object dicts are produced lazily while the report is written, on
+    # the main thread: bpy data must not be read from worker threads, and what
+    # is left per object (RNA reads, dict building) holds the GIL anyway. The
+    # NumPy part is already batched in _bboxes_world.
     focus: Dict[str, Any] = {}
+    focus_objects = None
     if export_collection_name:
         coll = bpy.data.collections.get(export_collection_name)
         focus["export_collection_exists"] = bool(coll)
-        focus["export_collection_reachable_from_scene"] = _is_collection_in_scene(scene, export_collection_name)
+        focus["export_collection_reachable_from_scene"] = _is_collection_in_scene(scene, export_collection_name, reachable)
         if coll:
             objs = _objects_in_collection_recursive(coll)
             focus["export_collection_recursive_object_count"] = len(objs)
@@ -697,7 +882,11 @@ def main() -> int:
                     f"Focus export collection has {len(objs_sorted)} objects; truncating to {args.max_scene_objects} in report."
                 )
                 objs_sorted = objs_sorted[: args.max_scene_objects]
-            focus["objects"] = [_object_to_dict(o, scene, mm_per_bu) for o in objs_sorted]
+            level = args.level
+            bboxes = _bboxes_world(objs_sorted) if level == "full" else [None] * len(objs_sorted)
+            focus_objects = (
+                _object_to_dict(o, scene, mm_per_bu, bb, level) for o, bb in zip(objs_sorted, bboxes)
+            )
         else:
             focus["objects"] = []
     else:
@@ -707,7 +896,9 @@ def main() -> int:
 
     # manifest checks (presence, files, matching collections, instances, etc.)
     if manifest and expected:
-        report["manifest_checks"] = _manifest_presence_checks(scene, expected, base_dir, mm_per_bu)
+        report["manifest_checks"] = _manifest_presence_checks(
+            scene, expected, base_dir, mm_per_bu, reachable, image_paths, library_paths
+        )
 
         # quick sanity: if components enabled false, mention
         try:
@@ -729,8 +920,8 @@ def main() -> int:
     except Exception:
         pass
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    with open(out_path, "wb") as f:
+        _write_report(f, report, focus_objects)
 
     # stdout summary
     print("\n[debug_dump] Wrote:", out_path)
@@ -744,7 +935,7 @@ def main() -> int:
         exp = expected.get("export_collection")
         if exp:
             exists = bool(bpy.data.collections.get(exp))
-            reach = _is_collection_in_scene(scene, exp)
+            reach = _is_collection_in_scene(scene, exp, reachable)
             print(f"[debug_dump] export_collection '{exp}': exists={exists}, reachable_from_scene={reach}")
 
         for side in ("left", "right"):
@@ -1,16 +1,22 @@
 print("testing!")
 
+import sys
+
 import bpy
 
 print("Current file:", bpy.data.filepath)
 
-hits = []
-for m in bpy.data.materials:
-    if m.name.startswith("MAT_"):
-        hits.append((m.name, "LINKED" if m.library else "LOCAL", m.users))
+# Optional: blender file.blend --python look_for_materials.py -- MAT_name
+argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+
+if argv:
+    mats = [m for m in map(bpy.data.materials.get, argv) if m is not None]
+else:
+    mats = [m for m in bpy.data.materials if m.name.startswith("MAT_")]
 
-for row in sorted(hits):
-    print(row)
+hits = sorted((m.name, "LINKED" if m.library else "LOCAL", m.users) for m in mats)
 
-print("Count MAT_*:", len(hits))
+if hits:
+    sys.stdout.write("\n".join(map(str, hits)) + "\n")
 
+print("Count MAT_*:" if not argv else "Count found:", len(hits))
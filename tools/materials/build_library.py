@@ -11,6 +11,8 @@ Optional:
   --recipes tools/materials/material_recipes.py
   --pack          # pack external data into the library (usually not required)
   --force-new     # ignore existing library and start fresh
+  --compress      # gzip the saved .blend (default: uncompressed; the library
+                  # is small, and git/packaging compress it anyway)
 
 This script is intended to be deterministic and version-control friendly:
 - materials are created/updated by stable name
@@ -20,15 +22,24 @@ This script is intended to be deterministic and version-control friendly:
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib.util
 import json
 import os
+import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, List
 
 import bpy
 
+try:  # optional, faster serializer
+    import orjson
+except ImportError:
+    orjson = None
 
+
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     # tools/materials/build_library.py -> materials -> tools -> repo root
     return Path(__file__).resolve().parents[2]
@@ -41,8 +52,16 @@ def resolve_repo_path(p: str) -> Path:
     return (repo_root() / pp).resolve()
 
 
+def abs_repo_path(p: str) -> Path:
+    """Like resolve_repo_path, but lexical only (no symlink resolution, no
+    filesystem access); for output paths that may not exist yet."""
+    pp = Path(p)
+    if pp.is_absolute():
+        return pp
+    return Path(os.path.normpath(repo_root() / pp))
+
+
 def argv_after_dashes() -> List[str]:
-    import sys
     if "--" in sys.argv:
         return sys.argv[sys.argv.index("--") + 1 :]
     return []
@@ -68,6 +87,12 @@ def parse_args() -> argparse.Namespace:
     )
     p.add_argument("--pack", action="store_true", help="Pack external resources into the library .blend")
     p.add_argument("--force-new", action="store_true", help="Start from a clean file even if library exists")
+    p.add_argument(
+        "--compress",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Compress the saved library .blend (default: off)",
+    )
 
     return p.parse_args(argv_after_dashes())
 
@@ -81,47 +106,75 @@ def import_recipes_module(recipes_path: Path):
     return mod
 
 
-def clean_scene() -> None:
-    # Remove all objects in the file (library doesn't need them)
-    for obj in list(bpy.data.objects):
+def _batch_remove(ids, remove) -> None:
+    # One batch_remove() pass instead of a remove() per ID, each of which walks
+    # the whole file to clear users of the freed ID.
+    if not ids:
+        return
+    try:
+        bpy.data.batch_remove(ids)
+        return
+    except Exception:
+        pass
+    for id_ in ids:
         try:
-            bpy.data.objects.remove(obj, do_unlink=True)
+            remove(id_)
         except Exception:
             pass
+
+
+def clean_scene() -> None:
+    # Remove all objects in the file (library doesn't need them)
+    _batch_remove(
+        bpy.data.objects[:],
+        lambda obj: bpy.data.objects.remove(obj, do_unlink=True),
+    )
     # Optionally remove collections except master
-    for col in list(bpy.data.collections):
-        if col.users == 0:
-            try:
-                bpy.data.collections.remove(col)
-            except Exception:
-                pass
+    _batch_remove(
+        [col for col in bpy.data.collections if col.users == 0],
+        bpy.data.collections.remove,
+    )
 
 
 def write_catalog(catalog_path: Path, recipes_mod) -> None:
-    mats = sorted([m.name for m in bpy.data.materials])
+    mats = sorted(bpy.data.materials.keys())
 
     data: Dict[str, Any] = {
         "library_blend": "assets/library/materials/materials.blend",
         "materials_in_file": mats,
-        "material_specs": getattr(recipes_mod, "MATERIAL_SPECS", {}),
+        # sorted by name so the catalog order doesn't depend on where a spec
+        # was added in the recipes file
+        "material_specs": dict(sorted(getattr(recipes_mod, "MATERIAL_SPECS", {}).items())),
     }
 
-    catalog_path.parent.mkdir(parents=True, exist_ok=True)
-    catalog_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        catalog_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+    else:
+        with catalog_path.open("w", encoding="utf-8", buffering=1 << 16) as fp:
+            json.dump(data, fp, indent=2)
+            fp.write("\n")
     print(f"[build_library] Wrote catalog: {catalog_path}")
 
 
 def main() -> None:
     args = parse_args()
 
-    library_path = resolve_repo_path(args.library)
+    library_path = abs_repo_path(args.library)
     recipes_path = resolve_repo_path(args.recipes)
-    catalog_path = resolve_repo_path(args.catalog)
+    catalog_path = abs_repo_path(args.catalog)
 
-    print(f"[build_library] repo_root = {repo_root()}")
-    print(f"[build_library] library  = {library_path}")
-    print(f"[build_library] recipes  = {recipes_path}")
-    print(f"[build_library] catalog  = {catalog_path}")
+    sys.stdout.write(
+        f"[build_library] repo_root = {repo_root()}\n"
+        f"[build_library] library  = {library_path}\n"
+        f"[build_library] recipes  = {recipes_path}\n"
+        f"[build_library] catalog  = {catalog_path}\n"
+    )
+
+    # Output directories, each created once (usually the same directory)
+    for d in {library_path.parent, catalog_path.parent}:
+        d.mkdir(parents=True, exist_ok=True)
 
     # Open existing library if present (unless force-new)
     if (not args.force_new) and library_path.exists():
@@ -138,10 +191,13 @@ def main() -> None:
             f"Recipes module {recipes_path} must define create_or_update_all_materials()"
         )
 
+    t0 = time.perf_counter()
     mats = recipes_mod.create_or_update_all_materials()
-    print(f"[build_library] Created/updated {len(mats)} materials:")
-    for m in mats:
-        print(f"  - {m.name}")
+    dt = time.perf_counter() - t0
+    sys.stdout.write(
+        f"[build_library] Created/updated {len(mats)} materials in {dt:.3f} s:\n"
+        + "".join(f"  - {m.name}\n" for m in mats)
+    )
 
     if args.pack:
         try:
@@ -151,8 +207,7 @@ def main() -> None:
             print(f"[build_library] WARN: pack_all failed: {e!r}")
 
     # Save library .blend
-    library_path.parent.mkdir(parents=True, exist_ok=True)
-    bpy.ops.wm.save_as_mainfile(filepath=str(library_path), check_existing=False, compress=True)
+    bpy.ops.wm.save_as_mainfile(filepath=str(library_path), check_existing=False, compress=args.compress)
     print(f"[build_library] Saved library: {library_path}")
 
     # Write catalog JSON (text, commit-friendly)
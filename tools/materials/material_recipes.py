@@ -16,10 +16,16 @@ Tip:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-import bpy
+# MATERIAL_SPECS is pure data; bpy is imported where Blender is actually used so
+# the spec table can be inspected outside Blender.
+if TYPE_CHECKING:
+    import bpy
 
 # ----------------------------
 # Material specifications
@@ -428,111 +434,206 @@ def _ensure_output_and_principled(nt: bpy.types.NodeTree) -> bpy.types.Node:
     nodes = nt.nodes
     links = nt.links
 
-    out = None
-    bsdf = None
-    for n in nodes:
-        if n.bl_idname == "ShaderNodeOutputMaterial":
-            out = n
-        elif n.bl_idname == "ShaderNodeBsdfPrincipled":
-            bsdf = n
+    # Default node names are a direct lookup; only scan if one of them misses
+    # (renamed or localized nodes).
+    out = nodes.get("Material Output")
+    if out is not None and out.bl_idname != "ShaderNodeOutputMaterial":
+        out = None
+    bsdf = nodes.get("Principled BSDF")
+    if bsdf is not None and bsdf.bl_idname != "ShaderNodeBsdfPrincipled":
+        bsdf = None
+
+    if out is None or bsdf is None:
+        for n in nodes:
+            bid = n.bl_idname
+            if bid == "ShaderNodeOutputMaterial":
+                if out is None:
+                    out = n
+            elif bid == "ShaderNodeBsdfPrincipled":
+                if bsdf is None:
+                    bsdf = n
+            if out is not None and bsdf is not None:
+                break
 
+    created = False
     if out is None:
         out = nodes.new("ShaderNodeOutputMaterial")
         out.location = (300, 0)
+        created = True
 
     if bsdf is None:
         bsdf = nodes.new("ShaderNodeBsdfPrincipled")
         bsdf.location = (0, 0)
+        created = True
 
-    # Ensure BSDF -> Output link exists
+    # Ensure BSDF -> Output link exists (an input socket has at most one link,
+    # so checking the Surface socket is enough; a fresh node has none)
     if "Surface" in out.inputs and "BSDF" in bsdf.outputs:
-        have = False
-        for l in links:
-            if (
-                l.from_node == bsdf
-                and l.to_node == out
-                and l.to_socket == out.inputs["Surface"]
-            ):
-                have = True
-                break
+        surf = out.inputs["Surface"]
+        have = (
+            not created
+            and surf.is_linked
+            and surf.links[0].from_node == bsdf
+        )
         if not have:
-            links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
+            links.new(bsdf.outputs["BSDF"], surf)
 
     return bsdf
 
 
-def _set_input(bsdf: bpy.types.Node, names: Sequence[str], value: Any) -> bool:
-    """Try multiple input socket names (Principled v1 vs v2)."""
-    for nm in names:
-        if nm in bsdf.inputs:
-            try:
-                bsdf.inputs[nm].default_value = value
-                return True
-            except Exception:
-                return False
-    return False
-
-
-def ensure_principled_material(name: str, spec: Dict[str, Any]) -> bpy.types.Material:
-    mat = bpy.data.materials.get(name)
-    if mat is None:
-        mat = bpy.data.materials.new(name=name)
+# Custom property holding the hash of the spec a material was last built from.
+_SPEC_HASH_PROP = "_spec_hash"
+# Bump when ensure_principled_material changes how a spec is applied.
+_RECIPE_VERSION = "principled_v1"
+
+
+def _spec_hash(spec: Dict[str, Any]) -> str:
+    payload = json.dumps([_RECIPE_VERSION, spec], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
 
-    mat.use_nodes = True
-    nt = mat.node_tree
-    bsdf = _ensure_output_and_principled(nt)
 
+# Spec key -> candidate Principled input names, in the order they are applied
+# (Principled v2 renamed several sockets, e.g. "Specular IOR Level").
+_SCALAR_INPUTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("metallic", ("Metallic",)),
+    ("roughness", ("Roughness",)),
+    ("specular", ("Specular", "Specular IOR Level")),
+    ("ior", ("IOR",)),
+    ("coat", ("Clearcoat", "Coat Weight")),
+    ("coat_roughness", ("Clearcoat Roughness", "Coat Roughness")),
+    # Optional extras (safe if present)
+    ("transmission", ("Transmission", "Transmission Weight")),
+    ("alpha", ("Alpha",)),
+)
+
+# Factors that must lie in [0, 1] (base color components are checked too)
+_UNIT_RANGE_KEYS = frozenset(
+    {"metallic", "roughness", "coat", "coat_roughness", "transmission", "alpha"}
+)
+
+SpecInputs = List[Tuple[Tuple[str, ...], Any]]
+
+
+def _compile_spec(name: str, spec: Dict[str, Any]) -> SpecInputs:
+    """(candidate socket names, value) pairs for *spec*, values already coerced.
+
+    Raises ValueError for non-finite values and out-of-range factors.
+    """
     base = spec.get("base_color_rgba", [1.0, 1.0, 1.0, 1.0])
     if len(base) == 3:
         base = [base[0], base[1], base[2], 1.0]
+    if len(base) != 4:
+        raise ValueError(f"{name}: base_color_rgba needs 3 or 4 components, got {len(base)}")
+    color = tuple(float(c) for c in base)
+    if not all(0.0 <= c <= 1.0 for c in color):
+        raise ValueError(f"{name}: base_color_rgba components must be in [0, 1], got {list(color)}")
+    inputs: SpecInputs = [(("Base Color",), color)]
+    for key, names in _SCALAR_INPUTS:
+        if key in spec:
+            value = float(spec[key])
+            if not math.isfinite(value):
+                raise ValueError(f"{name}: {key} must be finite, got {value}")
+            if key in _UNIT_RANGE_KEYS and not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name}: {key} must be in [0, 1], got {value}")
+            inputs.append((names, value))
+    return inputs
+
+
+def _compiled_spec(name: str, spec: Dict[str, Any]) -> Tuple[str, SpecInputs]:
+    """(hash, inputs) for *spec*; precomputed at import for MATERIAL_SPECS entries."""
+    compiled = _COMPILED_SPECS.get(name)
+    if compiled is not None and compiled[0] is spec:
+        return compiled[1], compiled[2]
+    return _spec_hash(spec), _compile_spec(name, spec)
+
+
+# candidate names -> index of the first one the running Blender's Principled
+# BSDF has (or None)
+_SOCKET_INDEX_CACHE: Dict[Tuple[str, ...], Optional[int]] = {}
+
+
+def _socket_value_equal(cur: Any, value: Any, eps: float = 1e-6) -> bool:
+    """Compare a socket default_value (stored as float32) with a target value."""
+    if isinstance(value, tuple):
+        try:
+            return len(cur) == len(value) and all(
+                abs(c - v) <= eps for c, v in zip(cur, value)
+            )
+        except TypeError:
+            return False
+    try:
+        return abs(cur - value) <= eps * max(1.0, abs(value))
+    except TypeError:
+        return False
 
-    _set_input(
-        bsdf,
-        ["Base Color"],
-        (float(base[0]), float(base[1]), float(base[2]), float(base[3])),
-    )
 
-    if "metallic" in spec:
-        _set_input(bsdf, ["Metallic"], float(spec["metallic"]))
+def _set_input(bsdf: bpy.types.Node, names: Sequence[str], value: Any) -> bool:
+    """Try multiple input socket names (Principled v1 vs v2).
 
-    if "roughness" in spec:
-        _set_input(bsdf, ["Roughness"], float(spec["roughness"]))
+    Every Principled BSDF in a session has the same sockets, so the probe
+    runs once per list of candidate names and later calls index by position.
+    """
+    key = tuple(names)
+    try:
+        idx = _SOCKET_INDEX_CACHE[key]
+    except KeyError:
+        idx = None
+        for n in names:
+            i = bsdf.inputs.find(n)
+            if i >= 0:
+                idx = i
+                break
+        _SOCKET_INDEX_CACHE[key] = idx
+    if idx is None:
+        return False
+    try:
+        sock = bsdf.inputs[idx]
+        # Skip no-op writes: each assignment tags the material for update.
+        if not _socket_value_equal(sock.default_value, value):
+            sock.default_value = value
+        return True
+    except Exception:
+        return False
 
-    if "specular" in spec:
-        # Principled v2 uses "Specular IOR Level"
-        _set_input(
-            bsdf,
-            ["Specular", "Specular IOR Level"],
-            float(spec["specular"]),
-        )
 
-    if "ior" in spec:
-        _set_input(bsdf, ["IOR"], float(spec["ior"]))
+def ensure_principled_material(
+    name: str,
+    spec: Dict[str, Any],
+    existing: Optional[Dict[str, bpy.types.Material]] = None,
+) -> bpy.types.Material:
+    """Create or update material *name* from *spec*.
 
-    if "coat" in spec:
-        _set_input(
-            bsdf,
-            ["Clearcoat", "Coat Weight"],
-            float(spec["coat"]),
-        )
+    *existing* is an optional name -> material snapshot of bpy.data.materials;
+    newly created materials are added to it.
 
-    if "coat_roughness" in spec:
-        _set_input(
-            bsdf,
-            ["Clearcoat Roughness", "Coat Roughness"],
-            float(spec["coat_roughness"]),
-        )
+    A material whose stored _SPEC_HASH_PROP matches the spec is returned as is.
+    """
+    import bpy
+
+    spec_hash, inputs = _compiled_spec(name, spec)
+    if existing is None:
+        mat = bpy.data.materials.get(name)
+    else:
+        mat = existing.get(name)
+    if (
+        mat is not None
+        and mat.get(_SPEC_HASH_PROP) == spec_hash
+        and mat.use_nodes
+        and mat.node_tree is not None
+    ):
+        return mat
+    if mat is None:
+        mat = bpy.data.materials.new(name=name)
+        if existing is not None:
+            existing[mat.name] = mat
 
-    # Optional extras (safe if present)
-    if "transmission" in spec:
-        _set_input(
-            bsdf,
-            ["Transmission", "Transmission Weight"],
-            float(spec["transmission"]),
-        )
+    if not mat.use_nodes:
+        mat.use_nodes = True
+    nt = mat.node_tree
+    bsdf = _ensure_output_and_principled(nt)
 
-    if "alpha" in spec:
-        _set_input(bsdf, ["Alpha"], float(spec["alpha"]))
+    for names, value in inputs:
+        _set_input(bsdf, names, value)
 
     # Keep materials around even if currently unused in the library file
     try:
@@ -540,6 +641,7 @@ def ensure_principled_material(name: str, spec: Dict[str, Any]) -> bpy.types.Mat
     except Exception:
         pass
 
+    mat[_SPEC_HASH_PROP] = spec_hash
     return mat
 
 
@@ -554,10 +656,21 @@ def create_or_update_all_materials() -> List[bpy.types.Material]:
     Returns:
         List of created/updated materials.
     """
+    import bpy
+
     mats: List[bpy.types.Material] = []
+    # One snapshot of the local materials instead of a lookup per spec
+    existing = {m.name: m for m in bpy.data.materials if m.library is None}
     for name, spec in MATERIAL_SPECS.items():
         shader = str(spec.get("shader", "principled")).lower()
         if shader != "principled":
             raise ValueError(f"Unsupported shader type for {name}: {shader}")
-        mats.append(ensure_principled_material(name, spec))
+        mats.append(ensure_principled_material(name, spec, existing))
     return mats
+
+
+# MATERIAL_SPECS is static: hash and coerce every entry once at import.
+_COMPILED_SPECS: Dict[str, Tuple[Dict[str, Any], str, SpecInputs]] = {
+    _name: (_spec, _spec_hash(_spec), _compile_spec(_name, _spec))
+    for _name, _spec in MATERIAL_SPECS.items()
+}
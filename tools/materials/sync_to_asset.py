@@ -22,6 +22,8 @@ Usage (from repo root):
     --pack
 
 Notes:
+- The output .blend is compressed in bake modes and written uncompressed in LINK mode;
+  override with --compress / --no-compress.
 - In LINK mode, adding *new* materials later requires running LINK again (to bring the new datablocks in).
   Changes to existing linked materials automatically propagate when you open the asset/poster.
 - In BAKE mode, this script tries to remove *library* dependencies by copying linked datablocks locally.
@@ -31,7 +33,9 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
+import re
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
@@ -77,12 +81,20 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--pack", action="store_true", help="Pack external resources into the output asset .blend")
     p.add_argument("--no-pack", action="store_true", help="Disable packing (overrides --pack)")
     p.add_argument("--bake-used-only", action="store_true", help="Bake only linked materials that are used")
+    p.add_argument(
+        "--compress",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Compress the saved .blend (default: on for bake modes, off for link)",
+    )
 
     return p.parse_args(argv_after_dashes())
 
 
 def _make_paths_relative() -> None:
-    # Best-effort relative paths for images and other filepaths
+    # Best-effort relative paths for images and other filepaths. The operator covers
+    # every path-bearing datablock type (movie clips, volumes, caches, ...) and runs
+    # once per file, so its dispatch overhead doesn't matter here.
     try:
         bpy.ops.file.make_paths_relative()
     except Exception:
@@ -98,21 +110,21 @@ def _link_materials_from_library(library_path: Path, patterns: List[str]) -> Lis
     if not library_path.exists():
         raise FileNotFoundError(f"Material library not found: {library_path}")
 
+    # One regex for all globs instead of fnmatch() per name x pattern
+    match = re.compile("|".join(f"(?:{fnmatch.translate(pat)})" for pat in patterns)).fullmatch
+
     already = {m.name for m in bpy.data.materials}
 
-    linked: List[str] = []
     with bpy.data.libraries.load(lib, link=True) as (data_from, data_to):
-        available = list(getattr(data_from, "materials", []))
-        want: List[str] = []
-        for nm in available:
-            if any(fnmatch.fnmatch(nm, pat) for pat in patterns):
-                # Avoid duplicating by name; load only missing
-                if nm not in already:
-                    want.append(nm)
-                else:
-                    linked.append(nm)  # already present (maybe previously linked)
+        matched = list(filter(match, getattr(data_from, "materials", [])))
+        # Avoid duplicating by name; load only missing
+        want: List[str] = [nm for nm in matched if nm not in already]
+        linked: List[str] = [nm for nm in matched if nm in already]  # already present (maybe previously linked)
         data_to.materials = want
 
+    # Newly linked materials are now in bpy.data.materials under their library names
+    linked.extend(want)
+
     # Mark as fake user so they remain in file even if not assigned yet
     for nm in linked:
         mat = bpy.data.materials.get(nm)
@@ -123,167 +135,138 @@ def _link_materials_from_library(library_path: Path, patterns: List[str]) -> Lis
         except Exception:
             pass
 
-    # Any newly linked materials are now in bpy.data.materials
-    for mat in bpy.data.materials:
-        if mat.name not in already and any(fnmatch.fnmatch(mat.name, pat) for pat in patterns):
-            linked.append(mat.name)
-            try:
-                mat.use_fake_user = True
-            except Exception:
-                pass
-
-    linked = sorted(set(linked))
     print(f"[sync_to_asset] Linked/ensured {len(linked)} materials from library.")
     return linked
 
 
-def _iter_node_trees() -> Iterable[bpy.types.NodeTree]:
-    """Yield node trees where linked images/nodegroups may appear."""
+def _iter_node_trees(local_only: bool = False) -> Iterable[bpy.types.NodeTree]:
+    """Yield node trees where linked images/nodegroups may appear.
+
+    With local_only, skip trees owned by linked datablocks: they can't be edited
+    and are being replaced by local copies anyway.
+    """
     for m in bpy.data.materials:
-        if m and m.use_nodes and m.node_tree:
+        if m and m.use_nodes and m.node_tree and not (local_only and m.library is not None):
             yield m.node_tree
     for ng in bpy.data.node_groups:
-        if ng and ng.nodes:
+        if ng and ng.nodes and not (local_only and ng.library is not None):
             yield ng
     # World(s)
     for w in bpy.data.worlds:
-        if w and w.use_nodes and w.node_tree:
+        if w and w.use_nodes and w.node_tree and not (local_only and w.library is not None):
             yield w.node_tree
 
 
-def _bake_linked_images() -> int:
-    linked = [img for img in bpy.data.images if getattr(img, "library", None) is not None]
-    if not linked:
-        return 0
+def _copy_linked(ids: Iterable[bpy.types.ID], kind: str) -> Dict[int, Tuple[bpy.types.ID, bpy.types.ID]]:
+    """Copy each linked datablock to a local one that takes over its name.
 
-    mapping: Dict[bpy.types.Image, bpy.types.Image] = {}
-    for img in linked:
+    The linked original is renamed to "<name>__LINKED" before copying, so the copy
+    normally gets the original name directly (no temporary name round-trip).
+    Returns {linked.as_pointer(): (linked, local copy)}. Keyed by pointer since bpy
+    wrappers are re-created on access and hashing them goes through RNA.
+    """
+    mapping: Dict[int, Tuple[bpy.types.ID, bpy.types.ID]] = {}
+    for idb in ids:
+        old_name = idb.name
         try:
-            new_img = img.copy()
-            new_img.name = img.name + "__LOCAL_TMP"
-            mapping[img] = new_img
-        except Exception as e:
-            print(f"[sync_to_asset] WARN: Could not copy image {img.name}: {e!r}")
-
-    # Replace image references in nodes
-    for nt in _iter_node_trees():
-        for node in nt.nodes:
-            if hasattr(node, "image") and node.image in mapping:
-                node.image = mapping[node.image]
-
-    # Rename + remove old
-    for old, new in mapping.items():
-        old_name = old.name
-        try:
-            old.name = old_name + "__LINKED"
+            idb.name = old_name + "__LINKED"
         except Exception:
             pass
         try:
-            new.name = old_name
-        except Exception:
-            pass
-        try:
-            if old.users == 0:
-                bpy.data.images.remove(old)
-        except Exception:
-            pass
-
-    return len(mapping)
-
-
-def _bake_linked_node_groups() -> int:
-    linked = [ng for ng in bpy.data.node_groups if getattr(ng, "library", None) is not None]
-    if not linked:
-        return 0
-
-    mapping: Dict[bpy.types.NodeTree, bpy.types.NodeTree] = {}
-    for ng in linked:
-        try:
-            new_ng = ng.copy()
-            new_ng.name = ng.name + "__LOCAL_TMP"
-            mapping[ng] = new_ng
+            new_idb = idb.copy()
         except Exception as e:
-            print(f"[sync_to_asset] WARN: Could not copy node group {ng.name}: {e!r}")
-
-    # Replace group-node references
-    for nt in _iter_node_trees():
-        for node in nt.nodes:
-            if getattr(node, "type", None) == "GROUP" and getattr(node, "node_tree", None) in mapping:
-                node.node_tree = mapping[node.node_tree]
-
-    # Rename + remove old
-    for old, new in mapping.items():
-        old_name = old.name
-        try:
-            old.name = old_name + "__LINKED"
-        except Exception:
-            pass
-        try:
-            new.name = old_name
-        except Exception:
-            pass
-        try:
-            if old.users == 0:
-                bpy.data.node_groups.remove(old)
-        except Exception:
-            pass
+            print(f"[sync_to_asset] WARN: Could not copy {kind} {old_name}: {e!r}")
+            try:
+                idb.name = old_name
+            except Exception:
+                pass
+            continue
+        if new_idb.name != old_name:
+            try:
+                new_idb.name = old_name
+            except Exception:
+                pass
+        mapping[idb.as_pointer()] = (idb, new_idb)
+    return mapping
 
-    return len(mapping)
 
+def _bake_linked_all(used_only: bool) -> Tuple[int, int, int]:
+    """Make linked materials, node groups and images local in a single pass.
 
-def _bake_linked_materials(used_only: bool) -> int:
-    linked = [m for m in bpy.data.materials if getattr(m, "library", None) is not None]
+    Returns (materials, node_groups, images) baked.
+    """
+    linked_mats = [m for m in bpy.data.materials if getattr(m, "library", None) is not None]
     if used_only:
-        linked = [m for m in linked if m.users > 0]
-
-    if not linked:
-        return 0
-
-    mapping: Dict[bpy.types.Material, bpy.types.Material] = {}
-    for m in linked:
-        try:
-            new_m = m.copy()
-            new_m.name = m.name + "__LOCAL_TMP"
-            mapping[m] = new_m
-        except Exception as e:
-            print(f"[sync_to_asset] WARN: Could not copy material {m.name}: {e!r}")
+        linked_mats = [m for m in linked_mats if m.users > 0]
 
-    # Replace object material slots
-    for obj in bpy.data.objects:
-        try:
-            if not hasattr(obj, "material_slots"):
-                continue
-            for slot in obj.material_slots:
-                if slot.material in mapping:
-                    slot.material = mapping[slot.material]
-        except Exception:
-            pass
+    # Copy materials first so their (local) node trees are patched by the walk below.
+    mat_map = _copy_linked(linked_mats, "material")
+    ng_map = _copy_linked(
+        [ng for ng in bpy.data.node_groups if getattr(ng, "library", None) is not None], "node group"
+    )
+    img_map = _copy_linked(
+        [img for img in bpy.data.images if getattr(img, "library", None) is not None], "image"
+    )
 
-    # Rename + remove old
-    for old, new in mapping.items():
-        old_name = old.name
-        try:
-            old.name = old_name + "__LINKED"
-        except Exception:
-            pass
-        try:
-            new.name = old_name
-        except Exception:
-            pass
-        try:
-            if old.users == 0:
-                bpy.data.materials.remove(old)
-        except Exception:
-            pass
+    # Replace image and group-node references in one walk over all node trees
+    if ng_map or img_map:
+        do_images = bool(img_map)
+        do_groups = bool(ng_map)
+        for nt in _iter_node_trees(local_only=True):
+            for node in nt.nodes:
+                img = getattr(node, "image", None) if do_images else None
+                if img is not None:
+                    hit = img_map.get(img.as_pointer())
+                    if hit is not None:
+                        node.image = hit[1]
+                if do_groups and getattr(node, "type", None) == "GROUP":
+                    ng = node.node_tree
+                    hit = ng_map.get(ng.as_pointer()) if ng is not None else None
+                    if hit is not None:
+                        node.node_tree = hit[1]
+
+    # Replace object material slots: index slot users once, then touch only affected slots
+    if mat_map:
+        slot_users: Dict[int, List[Tuple[bpy.types.Object, int]]] = defaultdict(list)
+        for obj in bpy.data.objects:
+            for i, slot in enumerate(getattr(obj, "material_slots", ())):
+                m = slot.material
+                if m is not None:
+                    slot_users[m.as_pointer()].append((obj, i))
+
+        for key, (_old, new) in mat_map.items():
+            for obj, i in slot_users.get(key, ()):
+                try:
+                    obj.material_slots[i].material = new
+                except Exception:
+                    pass
+
+    # Remove unused originals (materials first, so their users of groups/images are released)
+    for coll, mapping in (
+        (bpy.data.materials, mat_map),
+        (bpy.data.node_groups, ng_map),
+        (bpy.data.images, img_map),
+    ):
+        for old, _new in mapping.values():
+            try:
+                if old.users == 0:
+                    coll.remove(old)
+            except Exception:
+                pass
 
-    return len(mapping)
+    return len(mat_map), len(ng_map), len(img_map)
 
 
 def _report_remaining_linked() -> None:
-    mats = [m.name for m in bpy.data.materials if getattr(m, "library", None) is not None]
-    ngs = [ng.name for ng in bpy.data.node_groups if getattr(ng, "library", None) is not None]
-    imgs = [im.name for im in bpy.data.images if getattr(im, "library", None) is not None]
-    libs = {getattr(idb.library, "filepath", None) for idb in (list(bpy.data.materials) + list(bpy.data.node_groups) + list(bpy.data.images)) if getattr(idb, "library", None) is not None}
+    # One pass per collection, gathering names and library paths together
+    libs = set()
+    mats, ngs, imgs = [], [], []
+    for coll, names in ((bpy.data.materials, mats), (bpy.data.node_groups, ngs), (bpy.data.images, imgs)):
+        for idb in coll:
+            lib = getattr(idb, "library", None)
+            if lib is not None:
+                names.append(idb.name)
+                libs.add(getattr(lib, "filepath", None))
 
     libs = sorted([x for x in libs if x])
     print(f"[sync_to_asset] Remaining linked datablocks: materials={len(mats)} node_groups={len(ngs)} images={len(imgs)}")
@@ -293,12 +276,30 @@ def _report_remaining_linked() -> None:
             print(f"  - {l}")
 
 
+_PACKABLE_SOURCES = {"FILE", "TILED"}
+
+
 def _pack_all() -> None:
-    try:
-        bpy.ops.file.pack_all()
-        print("[sync_to_asset] Packed external resources into the output asset.")
-    except Exception as e:
-        print(f"[sync_to_asset] WARN: pack_all failed: {e!r}")
+    n = 0
+    for coll in (bpy.data.images, bpy.data.fonts, bpy.data.sounds):
+        for idb in coll:
+            if idb.packed_file or getattr(idb, "library", None) is not None:
+                continue
+            fp = getattr(idb, "filepath", "")
+            if not fp or fp == "<builtin>":
+                continue
+            # FILE and TILED (UDIM) images pack; movies and image sequences can't
+            source = getattr(idb, "source", "FILE")
+            if source not in _PACKABLE_SOURCES:
+                if source != "GENERATED":
+                    print(f"[sync_to_asset] WARN: Not packing {idb.name} ({source}); it stays external: {fp}")
+                continue
+            try:
+                idb.pack()
+                n += 1
+            except Exception as e:
+                print(f"[sync_to_asset] WARN: Could not pack {idb.name}: {e!r}")
+    print(f"[sync_to_asset] Packed {n} external resources into the output asset.")
 
 
 def main() -> None:
@@ -335,10 +336,8 @@ def main() -> None:
 
     if args.mode in ("bake", "link_then_bake"):
         used_only = bool(args.bake_used_only)
-        n_mat = _bake_linked_materials(used_only=used_only)
-        # After materials are local, bake their dependencies too.
-        n_ng = _bake_linked_node_groups()
-        n_img = _bake_linked_images()
+        # Materials and their dependencies (node groups, images) are made local together.
+        n_mat, n_ng, n_img = _bake_linked_all(used_only=used_only)
 
         print(f"[sync_to_asset] Baked to local copies: materials={n_mat} node_groups={n_ng} images={n_img}")
 
@@ -351,7 +350,9 @@ def main() -> None:
         _report_remaining_linked()
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    bpy.ops.wm.save_as_mainfile(filepath=str(out_path), check_existing=False, compress=True)
+    # Dev-loop link output is rewritten often; only compress published (baked) assets by default
+    compress = args.compress if args.compress is not None else args.mode != "link"
+    bpy.ops.wm.save_as_mainfile(filepath=str(out_path), check_existing=False, compress=compress)
     print(f"[sync_to_asset] Saved: {out_path}")
 
 